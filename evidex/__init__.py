@@ -6,8 +6,13 @@ with strict citation requirements and no external knowledge.
 """
 
 from evidex.models import Paragraph, Section, Document, Equation, Entities, Motivation, QAResponse
-from evidex.qa import explain_question
-from evidex.llm import LLMInterface, MockLLM, GroqLLM
+from evidex.qa import (
+    explain_question,
+    explain_questions_batch,
+    aexplain_question,
+    explain_questions_concurrent,
+)
+from evidex.llm import LLMInterface, MockLLM, GroqLLM, CachedLLM
 from evidex.graph import (
     QAState,
     planner_node,
@@ -17,6 +22,7 @@ from evidex.graph import (
     verifier_node,
     evidence_linker_node,
     composer_node,
+    build_composer_messages,
     build_composer_prompt,
     parse_composer_response,
     verify_composed_explanation,
@@ -49,6 +55,8 @@ from evidex.motivations import (
     extract_motivations_for_document,
     search_motivations,
     get_motivation_summary,
+    MotivationIndex,
+    get_motivation_index,
 )
 
 __all__ = [
@@ -62,10 +70,14 @@ __all__ = [
     "QAResponse",
     # Original Q&A
     "explain_question",
+    "explain_questions_batch",
+    "aexplain_question",
+    "explain_questions_concurrent",
     # LLM
     "LLMInterface",
     "MockLLM",
     "GroqLLM",
+    "CachedLLM",
     # LangGraph components
     "QAState",
     "planner_node",
@@ -75,6 +87,7 @@ __all__ = [
     "verifier_node",
     "evidence_linker_node",
     "composer_node",
+    "build_composer_messages",
     "build_composer_prompt",
     "parse_composer_response",
     "verify_composed_explanation",
@@ -104,4 +117,6 @@ __all__ = [
     "extract_motivations_for_document",
     "search_motivations",
     "get_motivation_summary",
+    "MotivationIndex",
+    "get_motivation_index",
 ]
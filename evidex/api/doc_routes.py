@@ -210,10 +210,11 @@ def sanitize_debug_output(raw_response: dict) -> dict | None:
         sanitized["verifier_reason"] = raw_debug["verifier_reason"]
     
     # Include evidence links summary (IDs only) if present
-    if "linked_evidence" in raw_debug:
+    linked_evidence = raw_debug.get("linked_evidence")
+    if linked_evidence is not None:
         sanitized["evidence_links"] = [
             {"source_ids": link.get("source_ids", [])}
-            for link in raw_debug.get("linked_evidence", [])
+            for link in linked_evidence
         ]
     
     return sanitized if sanitized else None
@@ -501,7 +502,7 @@ def explain_document_question(
     # Normalize paragraph IDs
     paragraph_ids = request.paragraph_ids
     if paragraph_ids is not None:
-        paragraph_ids = [pid.strip() for pid in paragraph_ids if pid.strip()]
+        paragraph_ids = [pid for pid in (raw.strip() for raw in paragraph_ids) if pid]
         if not paragraph_ids:
             paragraph_ids = None
     
@@ -531,11 +532,12 @@ def explain_document_question(
         # If context_text is provided, integrate it into the question
         # This allows user-selected text to serve as additional context
         final_question = question
-        if request.context_text and request.context_text.strip():
+        context_text = request.context_text.strip() if request.context_text else ""
+        if context_text:
             context_preamble = (
                 "The user has selected the following context from the document. "
                 "Use this context to help answer the question:\n\n"
-                f"--- SELECTED CONTEXT ---\n{request.context_text.strip()}\n--- END CONTEXT ---\n\n"
+                f"--- SELECTED CONTEXT ---\n{context_text}\n--- END CONTEXT ---\n\n"
                 f"Question: {question}"
             )
             final_question = context_preamble
@@ -36,6 +36,8 @@ class DocumentEntry:
         file_path: Path to the source PDF file
         created_at: When the document was uploaded
         error_message: Error details if status is FAILED
+        ready_event: Set once ingestion finishes (READY or FAILED) and
+            cleared while ingesting, so callers can wait instead of polling
     """
     document_id: str
     title: str
@@ -44,6 +46,13 @@ class DocumentEntry:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     document: Document | None = None
     error_message: str | None = None
+    ready_event: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        if self.status != DocumentStatus.INGESTING:
+            self.ready_event.set()
 
 
 class DocumentRegistry:
@@ -107,6 +116,10 @@ class DocumentRegistry:
                     entry.document = document
                 if error_message is not None:
                     entry.error_message = error_message
+                if status == DocumentStatus.INGESTING:
+                    entry.ready_event.clear()
+                else:
+                    entry.ready_event.set()
     
     def list_all(self) -> list[DocumentEntry]:
         """List all document entries.
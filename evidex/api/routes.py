@@ -79,8 +79,8 @@ def normalize_paragraph_ids(paragraph_ids: list[str] | None) -> list[str] | None
     if paragraph_ids is None:
         return None
     
-    # Strip whitespace from each ID, filter empty strings
-    normalized = [pid.strip() for pid in paragraph_ids if pid.strip()]
+    # Strip whitespace from each ID (once), filter empty strings
+    normalized = [pid for pid in (raw.strip() for raw in paragraph_ids) if pid]
     
     # Return None if list is empty after normalization
     return normalized if normalized else None
@@ -119,10 +119,11 @@ def sanitize_debug_output(raw_response: dict) -> dict | None:
         sanitized["verifier_reason"] = raw_debug["verifier_reason"]
     
     # Include evidence links summary (IDs only) if present
-    if "linked_evidence" in raw_debug:
+    linked_evidence = raw_debug.get("linked_evidence")
+    if linked_evidence is not None:
         sanitized["evidence_links"] = [
             {"source_ids": link.get("source_ids", [])}
-            for link in raw_debug.get("linked_evidence", [])
+            for link in linked_evidence
         ]
     
     return sanitized if sanitized else None
@@ -40,9 +40,11 @@ VARIABLE_PATTERNS = [
     r'\blayer_?[0-9]*\b',
 ]
 
-# Compile patterns for efficiency
+# Compile patterns for efficiency. Every pattern starts at a word boundary
+# with one of these letters, so the lookahead rejects all other positions
+# before the alternation is tried pattern by pattern.
 _VARIABLE_REGEX = re.compile(
-    '|'.join(f'({p})' for p in VARIABLE_PATTERNS),
+    r'\b(?=[dhklnpqvwxyz])(?:' + '|'.join(f'(?:{p})' for p in VARIABLE_PATTERNS) + ')',
     re.IGNORECASE
 )
 
@@ -58,20 +60,17 @@ def extract_variables(text: str) -> list[str]:
     Returns:
         List of unique variable names found (preserving first occurrence order)
     """
-    # Find all matches
-    matches = _VARIABLE_REGEX.findall(text)
-    
-    # Flatten the tuple groups and filter empty strings
     found = []
-    seen = set()
-    for match_tuple in matches:
-        for m in match_tuple:
-            if m and m not in seen:
-                # Normalize: keep original case but dedupe case-insensitively
-                normalized = m.strip()
-                if normalized.lower() not in {v.lower() for v in seen}:
-                    found.append(normalized)
-                    seen.add(normalized)
+    seen_lower = set()
+    # Each match is exactly one of the alternated patterns, so the whole
+    # match is the variable; no need to flatten findall's group tuples
+    for match in _VARIABLE_REGEX.finditer(text):
+        # Normalize: keep original case but dedupe case-insensitively
+        normalized = match.group().strip()
+        key = normalized.lower()
+        if normalized and key not in seen_lower:
+            found.append(normalized)
+            seen_lower.add(key)
     
     return found
 
@@ -109,10 +108,45 @@ CONCEPT_KEYWORDS = {
     'input', 'output', 'query', 'key', 'value', 'mask', 'padding',
 }
 
-# Build regex pattern for concept matching (word boundaries, case insensitive)
-_CONCEPT_PATTERNS = sorted(CONCEPT_KEYWORDS, key=len, reverse=True)  # Longest first
+
+def _keyword_trie_pattern(keywords: set[str]) -> str:
+    """Build a regex matching any keyword, factored into a prefix trie.
+    
+    A flat alternation makes the regex engine retry every keyword at each
+    position; the trie shares common prefixes (e.g. 'layer', 'layer norm',
+    'layer normalization') so each position is scanned once per branch.
+    Optional tails are greedy, so the longest keyword that satisfies the
+    rest of the pattern wins, as with a longest-first alternation.
+    
+    Args:
+        keywords: Lowercase keywords to match
+        
+    Returns:
+        Regex source matching exactly the given keywords
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}  # Marks the end of a keyword
+    
+    def emit(node: dict) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return emit(trie)
+
+
+# Build regex pattern for concept matching (word boundaries, case insensitive).
+# The lookahead on the keywords' first letters rejects most positions before
+# the trie is entered.
+_CONCEPT_FIRST_LETTERS = ''.join(sorted({c[0] for c in CONCEPT_KEYWORDS}))
 _CONCEPT_REGEX = re.compile(
-    r'\b(' + '|'.join(re.escape(c) for c in _CONCEPT_PATTERNS) + r')\b',
+    r'\b(?=[' + _CONCEPT_FIRST_LETTERS + r'])(' + _keyword_trie_pattern(CONCEPT_KEYWORDS) + r')\b',
     re.IGNORECASE
 )
 
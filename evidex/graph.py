@@ -6,13 +6,20 @@ explain_question logic. The behavior is IDENTICAL to the original function.
 """
 
 import logging
+import re
+import sys
+from functools import lru_cache
 from typing import TypedDict
 
 from langgraph.graph import StateGraph, START, END
 
 from evidex.models import Document, Paragraph, Equation, Entities
-from evidex.llm import LLMInterface, LLMResponse, parse_llm_response
-from evidex.qa import build_context_block, build_prompt, build_equations_block
+from evidex.llm import LLMInterface, LLMResponse, parse_llm_response, safe_parse_json
+from evidex.qa import (
+    build_context_block,
+    build_prompt_messages,
+    build_equations_block,
+)
 from evidex.entities import extract_entities_as_model
 
 logger = logging.getLogger(__name__)
@@ -72,6 +79,30 @@ class QAState(TypedDict, total=False):
 # Node Functions
 # =============================================================================
 
+# Common stop words to filter out
+_STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+    'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
+    'from', 'as', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'between', 'under', 'again', 'further', 'then',
+    'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'each',
+    'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+    'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and',
+    'but', 'if', 'or', 'because', 'until', 'while', 'although', 'though',
+    'this', 'that', 'these', 'those', 'what', 'which', 'who', 'whom',
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you',
+    'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his',
+    'himself', 'she', 'her', 'hers', 'herself', 'it', 'its', 'itself',
+    'they', 'them', 'their', 'theirs', 'themselves', 'about', 'also',
+    'paper', 'defined', 'describe', 'explain', 'discussed', 'mentioned',
+})
+
+# Words of letters and numbers, at least 2 chars
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z0-9]{2,}\b')
+
+
 def extract_keywords(text: str) -> set[str]:
     """Extract keywords from text for matching.
     
@@ -84,35 +115,35 @@ def extract_keywords(text: str) -> set[str]:
     Returns:
         Set of lowercase keywords
     """
-    import re
-    
-    # Common stop words to filter out
-    STOP_WORDS = {
-        'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-        'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
-        'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
-        'from', 'as', 'into', 'through', 'during', 'before', 'after',
-        'above', 'below', 'between', 'under', 'again', 'further', 'then',
-        'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'each',
-        'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
-        'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and',
-        'but', 'if', 'or', 'because', 'until', 'while', 'although', 'though',
-        'this', 'that', 'these', 'those', 'what', 'which', 'who', 'whom',
-        'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you',
-        'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his',
-        'himself', 'she', 'her', 'hers', 'herself', 'it', 'its', 'itself',
-        'they', 'them', 'their', 'theirs', 'themselves', 'about', 'also',
-        'paper', 'defined', 'describe', 'explain', 'discussed', 'mentioned',
-    }
-    
-    # Extract words (letters and numbers, at least 2 chars)
-    words = re.findall(r'\b[a-zA-Z0-9]{2,}\b', text.lower())
+    # Extract words (letters and numbers, at least 2 chars), dropping stop words
+    return {w for w in _KEYWORD_RE.findall(text.lower()) if w not in _STOP_WORDS}
+
+
+@lru_cache(maxsize=32)
+def _keyword_index(
+    paragraphs: tuple[tuple[str, str], ...],
+) -> tuple[tuple[tuple[str, set[str]], ...], dict[str, list[int]]]:
+    """Extract paragraph keywords once and index them by keyword.
     
-    # Filter stop words
-    keywords = {w for w in words if w not in STOP_WORDS}
+    Keyed on paragraph content rather than the Document object, so an
+    edited document is never served a stale index. The returned sets are
+    shared between calls and must not be mutated.
     
-    return keywords
+    Args:
+        paragraphs: Tuple of (paragraph_id, text) pairs in document order
+        
+    Returns:
+        Tuple of ((paragraph_id, keywords) per paragraph in document order,
+        mapping of keyword -> positions of the paragraphs containing it)
+    """
+    entries = []
+    postings: dict[str, list[int]] = {}
+    for position, (paragraph_id, text) in enumerate(paragraphs):
+        keywords = extract_keywords(text)
+        entries.append((paragraph_id, keywords))
+        for keyword in keywords:
+            postings.setdefault(keyword, []).append(position)
+    return tuple(entries), postings
 
 
 def planner_node(state: QAState) -> dict:
@@ -158,22 +189,22 @@ def planner_node(state: QAState) -> dict:
             "planner_selected_automatically": True,  # Planner made the selection
         }
     
-    # Score each paragraph by keyword overlap
+    # Only paragraphs sharing at least one keyword can score; find them
+    # through the inverted index instead of scanning every paragraph
+    entries, postings = _keyword_index(document.paragraph_key())
+    candidate_positions: set[int] = set()
+    for keyword in question_keywords:
+        candidate_positions.update(postings.get(keyword, ()))
+    
+    # Score each candidate paragraph by keyword overlap
     scored_paragraphs: list[tuple[str, int, int, set[str]]] = []  # (id, score, position, matched_keywords)
-    position = 0
-    
-    for section in document.sections:
-        for para in section.paragraphs:
-            para_keywords = extract_keywords(para.text)
-            
-            # Count keyword matches (intersection)
-            matches = question_keywords & para_keywords
-            score = len(matches)
-            
-            if score > 0:
-                scored_paragraphs.append((para.paragraph_id, score, position, matches))
-            
-            position += 1
+    
+    for position in sorted(candidate_positions):
+        paragraph_id, para_keywords = entries[position]
+        
+        # Count keyword matches (intersection)
+        matches = question_keywords & para_keywords
+        scored_paragraphs.append((paragraph_id, len(matches), position, matches))
     
     if not scored_paragraphs:
         # No matches found - return empty (will trigger "Not defined")
@@ -296,11 +327,12 @@ def explain_node(state: QAState) -> dict:
     # Build equations block if we have equations
     equations_context = build_equations_block(equations) if equations else ""
     
-    # Build prompt with both paragraphs and equations
-    prompt = build_prompt(context, question, equations_context)
+    # Build prompt with both paragraphs and equations, split into messages
+    # so the system prompt and document context form a cacheable prefix
+    messages = build_prompt_messages(context, question, equations_context)
     
     # Get LLM response
-    response = llm.generate(prompt)
+    response = llm.generate_messages(messages)
     
     # Parse and validate response
     parsed = parse_llm_response(response)
@@ -310,17 +342,27 @@ def explain_node(state: QAState) -> dict:
     logger.info(f"Parsed answer: {parsed.get('answer', 'N/A')[:100]}")
     logger.info(f"Parsed citations: {parsed.get('citations', [])}")
     
-    # Validate citations - only include citations that match provided paragraph IDs
-    valid_paragraph_ids = {p.paragraph_id for p in paragraphs}
-    valid_citations = [
-        cid for cid in parsed.get("citations", [])
-        if cid in valid_paragraph_ids
-    ]
+    answer = parsed.get("answer", "Not defined in the paper")
+    raw_citations = parsed.get("citations") or []
+    
+    if answer == "Not defined in the paper" or not raw_citations:
+        # "Not defined" answers carry no citations (see SYSTEM_PROMPT),
+        # and an empty list has nothing to validate
+        valid_citations = []
+    else:
+        # Validate citations - only include citations that match provided paragraph IDs.
+        # Kept citations are interned so they share the paragraph ID strings
+        # the verifier and API layers compare against.
+        valid_paragraph_ids = {p.paragraph_id for p in paragraphs}
+        valid_citations = [
+            sys.intern(cid) for cid in raw_citations
+            if cid in valid_paragraph_ids
+        ]
     
     # Note: confidence is computed by verifier_node based on system rules:
     # high = citations non-empty + verifier passed + planner selected automatically
     final_response = {
-        "answer": parsed.get("answer", "Not defined in the paper"),
+        "answer": answer,
         "citations": valid_citations,
         # confidence will be set by verifier_node
     }
@@ -366,7 +408,7 @@ def verifier_node(state: QAState) -> dict:
     
     # Check 1: If answer is NOT "Not defined in the paper", citations must be non-empty
     is_not_defined = answer == "Not defined in the paper"
-    has_citations = len(citations) > 0
+    has_citations = bool(citations)
     
     if not is_not_defined and not has_citations:
         # Answer claims to have information but provides no citations
@@ -414,12 +456,7 @@ def verifier_node(state: QAState) -> dict:
     #   1. citations are non-empty
     #   2. verifier passed (we're here, so yes)
     #   3. planner selected paragraphs automatically
-    verification_passed_without_override = True  # We passed all checks
-    
-    if has_citations and verification_passed_without_override and planner_selected_automatically:
-        confidence = "high"
-    else:
-        confidence = "low"
+    confidence = "high" if has_citations and planner_selected_automatically else "low"
     
     # Build reason
     if is_not_defined:
@@ -455,6 +492,26 @@ def verifier_node(state: QAState) -> dict:
     }
 
 
+@lru_cache(maxsize=1024)
+def _extract_evidence_entities(text: str) -> Entities:
+    """Extract entities from a paragraph or equation text, memoized by text.
+    
+    The evidence linker and the composer verifier both extract entities
+    for every equation and for paragraphs without pre-extracted entities,
+    so without the cache the same texts are scanned twice per question and
+    again for every later question over the same paragraphs.
+    
+    The returned Entities is shared between callers and must not be mutated.
+    
+    Args:
+        text: The paragraph or equation text
+        
+    Returns:
+        Entities extracted from the text
+    """
+    return extract_entities_as_model(text)
+
+
 def evidence_linker_node(state: QAState) -> dict:
     """Link related evidence based on shared entities.
     
@@ -493,7 +550,7 @@ def evidence_linker_node(state: QAState) -> dict:
         if para.entities:
             entities = para.entities
         else:
-            entities = extract_entities_as_model(para.text)
+            entities = _extract_evidence_entities(para.text)
         
         evidence_entities[para.paragraph_id] = {
             "variables": set(entities.variables),
@@ -502,7 +559,7 @@ def evidence_linker_node(state: QAState) -> dict:
     
     for eq in equations:
         # Extract entities from equation text
-        entities = extract_entities_as_model(eq.equation_text)
+        entities = _extract_evidence_entities(eq.equation_text)
         evidence_entities[eq.equation_id] = {
             "variables": set(entities.variables),
             "concepts": set(entities.concepts),
@@ -646,37 +703,64 @@ You must respond ONLY with a JSON object in this exact format:
 
 Do not include any text outside the JSON object."""
 
+# Static composer prompt scaffolding, assembled once at import so
+# build_composer_prompt only joins in the evidence, links and question
+_COMPOSER_EVIDENCE_START = "\n\n=== VERIFIED EVIDENCE ===\n"
 
-def build_composer_prompt(
+_COMPOSER_EVIDENCE_END = "\n=== END VERIFIED EVIDENCE ==="
+
+_COMPOSER_LINKS_HEADER = "\n\n=== LINKED EVIDENCE ===\nThe following evidence is connected:\n"
+
+_COMPOSER_LINKS_FOOTER = "\n=== END LINKED EVIDENCE ==="
+
+_COMPOSER_PROMPT_TAIL = """
+
+Compose an explanation using ONLY the verified evidence above. Each sentence must cite its source.
+
+JSON Response:"""
+
+
+def _build_composer_evidence(
     paragraphs: list[Paragraph],
     equations: list[Equation],
     linked_evidence: list[dict],
-    question: str,
 ) -> str:
-    """Build the composer prompt with verified evidence.
+    """Format the verified evidence and link sections of the composer prompt.
     
     Args:
         paragraphs: Verified paragraphs to compose from
         equations: Verified equations to compose from
         linked_evidence: Links between related evidence
-        question: The original question being answered
         
     Returns:
-        Complete prompt string for the composer
+        Evidence section text, from the VERIFIED EVIDENCE header through
+        the optional LINKED EVIDENCE block
     """
-    # Build evidence block
-    evidence_blocks = []
-    
+    # Build evidence block from its pieces, as build_context_block does,
+    # so each paragraph and equation text is copied once in the final join
+    buf = [_COMPOSER_EVIDENCE_START]
+    append = buf.append
     for para in paragraphs:
-        evidence_blocks.append(f"[{para.paragraph_id}] (paragraph)\n{para.text}")
-    
+        append("[")
+        append(para.paragraph_id)
+        append("] (paragraph)\n")
+        append(para.text)
+        append("\n\n")
     for eq in equations:
-        evidence_blocks.append(f"[{eq.equation_id}] (equation from {eq.associated_paragraph_id})\n{eq.equation_text}")
-    
-    evidence_text = "\n\n".join(evidence_blocks) if evidence_blocks else "No evidence provided."
+        append("[")
+        append(eq.equation_id)
+        append("] (equation from ")
+        append(eq.associated_paragraph_id)
+        append(")\n")
+        append(eq.equation_text)
+        append("\n\n")
+    if len(buf) > 1:
+        buf.pop()  # Trailing separator
+    else:
+        append("No evidence provided.")
+    append(_COMPOSER_EVIDENCE_END)
     
     # Build linked evidence section
-    links_text = ""
     if linked_evidence:
         link_descriptions = []
         for link in linked_evidence:
@@ -686,19 +770,66 @@ def build_composer_prompt(
             shared_items = shared_vars + shared_concepts
             shared_str = ", ".join(shared_items) if shared_items else "none"
             link_descriptions.append(f"  - Sources [{source_ids}] share: {shared_str}")
-        links_text = "\n\n=== LINKED EVIDENCE ===\nThe following evidence is connected:\n" + "\n".join(link_descriptions) + "\n=== END LINKED EVIDENCE ==="
+        append(_COMPOSER_LINKS_HEADER)
+        append("\n".join(link_descriptions))
+        append(_COMPOSER_LINKS_FOOTER)
     
-    return f"""{COMPOSER_SYSTEM_PROMPT}
+    return "".join(buf)
 
-=== VERIFIED EVIDENCE ===
-{evidence_text}
-=== END VERIFIED EVIDENCE ==={links_text}
 
-QUESTION: {question}
+def build_composer_messages(
+    paragraphs: list[Paragraph],
+    equations: list[Equation],
+    linked_evidence: list[dict],
+    question: str,
+) -> list[dict]:
+    """Build the composer prompt as chat messages ordered for prefix caching.
+    
+    The static composer system prompt is its own leading message, followed
+    by the evidence and then the question, mirroring build_prompt_messages
+    for the explain step. Concatenating the message contents yields exactly
+    build_composer_prompt().
+    
+    Args:
+        paragraphs: Verified paragraphs to compose from
+        equations: Verified equations to compose from
+        linked_evidence: Links between related evidence
+        question: The original question being answered
+        
+    Returns:
+        List of {"role": ..., "content": ...} message dicts
+    """
+    return [
+        {"role": "system", "content": COMPOSER_SYSTEM_PROMPT},
+        {"role": "user", "content": _build_composer_evidence(paragraphs, equations, linked_evidence)},
+        {"role": "user", "content": "".join(("\n\nQUESTION: ", question, _COMPOSER_PROMPT_TAIL))},
+    ]
 
-Compose an explanation using ONLY the verified evidence above. Each sentence must cite its source.
 
-JSON Response:"""
+def build_composer_prompt(
+    paragraphs: list[Paragraph],
+    equations: list[Equation],
+    linked_evidence: list[dict],
+    question: str,
+) -> str:
+    """Build the composer prompt with verified evidence.
+    
+    Args:
+        paragraphs: Verified paragraphs to compose from
+        equations: Verified equations to compose from
+        linked_evidence: Links between related evidence
+        question: The original question being answered
+        
+    Returns:
+        Complete prompt string for the composer
+    """
+    return "".join((
+        COMPOSER_SYSTEM_PROMPT,
+        _build_composer_evidence(paragraphs, equations, linked_evidence),
+        "\n\nQUESTION: ",
+        question,
+        _COMPOSER_PROMPT_TAIL,
+    ))
 
 
 def parse_composer_response(response) -> dict:
@@ -712,8 +843,6 @@ def parse_composer_response(response) -> dict:
     Returns:
         Dict with 'composed_explanation' and 'sentences' keys
     """
-    from evidex.llm import safe_parse_json
-    
     # Get text from response
     if hasattr(response, 'content'):
         text = response.content
@@ -737,7 +866,8 @@ def parse_composer_response(response) -> dict:
             if isinstance(sent, dict) and "text" in sent and "citation" in sent:
                 valid_sentences.append({
                     "text": str(sent["text"]),
-                    "citation": str(sent["citation"]),
+                    # Interned to match the interned paragraph/equation IDs
+                    "citation": sys.intern(str(sent["citation"])),
                 })
         
         return {
@@ -753,6 +883,16 @@ def parse_composer_response(response) -> dict:
         }
 
 
+# Technical concepts that the composer may not introduce unless present in
+# the sources. Lowercase to match the normalized output of extract_concepts.
+_TECHNICAL_CONCEPTS = frozenset({
+    'attention', 'transformer', 'encoder', 'decoder', 'embedding',
+    'softmax', 'layer normalization', 'dropout', 'residual',
+    'multi-head', 'self-attention', 'cross-attention', 'positional encoding',
+    'feedforward', 'bleu', 'bleu score', 'perplexity', 'accuracy',
+})
+
+
 def verify_composed_explanation(
     sentences: list[dict],
     valid_source_ids: set[str],
@@ -796,16 +936,19 @@ def verify_composed_explanation(
             allowed_entities.update(para.entities.variables)
             allowed_entities.update(para.entities.concepts)
         else:
-            # Extract on-the-fly
-            entities = extract_entities_as_model(para.text)
+            # Extract on-the-fly (shared with the evidence linker)
+            entities = _extract_evidence_entities(para.text)
             allowed_entities.update(entities.variables)
             allowed_entities.update(entities.concepts)
     
     for eq in equations:
-        entities = extract_entities_as_model(eq.equation_text)
+        entities = _extract_evidence_entities(eq.equation_text)
         allowed_entities.update(entities.variables)
         allowed_entities.update(entities.concepts)
     
+    # Technical concepts not backed by any source, computed once for all sentences
+    forbidden_concepts = _TECHNICAL_CONCEPTS - allowed_entities
+    
     # Check for new entities in composed text
     for sent in sentences:
         text = sent.get("text", "")
@@ -818,14 +961,8 @@ def verify_composed_explanation(
         
         # Concepts are more lenient - common words are OK
         # Only reject if it's a technical concept not in sources
-        TECHNICAL_CONCEPTS = {
-            'attention', 'transformer', 'encoder', 'decoder', 'embedding',
-            'softmax', 'layer normalization', 'dropout', 'residual',
-            'multi-head', 'self-attention', 'cross-attention', 'positional encoding',
-            'feedforward', 'bleu', 'bleu score', 'perplexity', 'accuracy',
-        }
         for concept in sent_entities.concepts:
-            if concept in TECHNICAL_CONCEPTS and concept not in allowed_entities:
+            if concept in forbidden_concepts:
                 return False, f"REJECTED: New technical concept '{concept}' introduced in composed explanation."
     
     return True, f"PASSED: Composed explanation verified with {len(sentences)} cited sentences."
@@ -869,11 +1006,12 @@ def composer_node(state: QAState) -> dict:
     for eq in equations:
         valid_source_ids.add(eq.equation_id)
     
-    # Build prompt
-    prompt = build_composer_prompt(paragraphs, equations, linked_evidence, question)
+    # Build prompt as messages so the static composer rules form a
+    # cacheable prefix for providers that support it
+    messages = build_composer_messages(paragraphs, equations, linked_evidence, question)
     
     # Get LLM response
-    response = llm.generate(prompt)
+    response = llm.generate_messages(messages)
     
     # Parse response
     parsed = parse_composer_response(response)
@@ -885,18 +1023,21 @@ def composer_node(state: QAState) -> dict:
         sentences, valid_source_ids, paragraphs, equations
     )
     
+    # Append the composer verdict to the verifier reason (built once)
+    verifier_reason = f"{state.get('verifier_reason', '')} Composer: {reason}"
+    
     # If verification failed, set composed_explanation to None
     if not passed:
         return {
             "composed_explanation": None,
             "composer_verification_passed": False,
-            "verifier_reason": state.get("verifier_reason", "") + f" Composer: {reason}",
+            "verifier_reason": verifier_reason,
         }
     
     return {
         "composed_explanation": composed_explanation,
         "composer_verification_passed": passed,
-        "verifier_reason": state.get("verifier_reason", "") + f" Composer: {reason}",
+        "verifier_reason": verifier_reason,
     }
 
 
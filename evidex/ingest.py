@@ -8,8 +8,12 @@ Equations are treated as first-class citizens and are extracted separately
 from prose content, with proper associations to their source paragraphs.
 """
 
+import bisect
 import hashlib
+import io
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from pypdf import PdfReader
@@ -17,9 +21,21 @@ from pypdf import PdfReader
 from evidex.models import Document, Section, Paragraph, Equation
 
 
+# Extracted text keyed by the SHA-256 of the PDF bytes, so re-uploads and
+# reparses of an unchanged file skip pypdf's text layer extraction, which
+# dominates ingestion time. Guarded by a lock since ingestion runs in
+# background threads.
+_PDF_TEXT_CACHE_SIZE = 16
+_pdf_text_cache: OrderedDict[str, str] = OrderedDict()
+_pdf_text_cache_lock = threading.Lock()
+
+
 def extract_text_from_pdf(pdf_path: str | Path) -> str:
     """Extract all text from a PDF file.
     
+    Results are memoized by file content, so the same PDF uploaded under
+    a different path is only parsed once.
+    
     Args:
         pdf_path: Path to the PDF file
         
@@ -27,7 +43,16 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
         Concatenated text from all pages
     """
     pdf_path = Path(pdf_path)
-    reader = PdfReader(pdf_path)
+    data = pdf_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    
+    with _pdf_text_cache_lock:
+        cached = _pdf_text_cache.get(digest)
+        if cached is not None:
+            _pdf_text_cache.move_to_end(digest)
+            return cached
+    
+    reader = PdfReader(io.BytesIO(data))
     
     pages_text = []
     for page in reader.pages:
@@ -35,7 +60,14 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
         if text:
             pages_text.append(text)
     
-    return "\n\n".join(pages_text)
+    text = "\n\n".join(pages_text)
+    
+    with _pdf_text_cache_lock:
+        _pdf_text_cache[digest] = text
+        while len(_pdf_text_cache) > _PDF_TEXT_CACHE_SIZE:
+            _pdf_text_cache.popitem(last=False)
+    
+    return text
 
 
 def generate_paragraph_id(section_index: int, paragraph_index: int) -> str:
@@ -89,6 +121,20 @@ def split_into_paragraphs(text: str, min_length: int = 50) -> list[str]:
     return paragraphs
 
 
+# Common patterns for section headers in academic papers
+SECTION_HEADER_PATTERNS = [
+    # Numbered sections: "1 Introduction", "2.1 Background"
+    r'^(\d+\.?\d*\.?\s+[A-Z][A-Za-z\s]+)$',
+    # All caps short text: "ABSTRACT", "INTRODUCTION"
+    r'^([A-Z][A-Z\s]{2,30})$',
+    # Title case short text that's likely a header
+    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,4})$',
+]
+
+# Compile once and keep the bound match methods for the per-paragraph loop
+_HEADER_MATCHERS = tuple(re.compile(p).match for p in SECTION_HEADER_PATTERNS)
+
+
 def detect_section_header(text: str) -> str | None:
     """Detect if text looks like a section header.
     
@@ -98,24 +144,20 @@ def detect_section_header(text: str) -> str | None:
     Returns:
         Section title if detected, None otherwise
     """
-    # Common patterns for section headers in academic papers
-    patterns = [
-        # Numbered sections: "1 Introduction", "2.1 Background"
-        r'^(\d+\.?\d*\.?\s+[A-Z][A-Za-z\s]+)$',
-        # All caps short text: "ABSTRACT", "INTRODUCTION"
-        r'^([A-Z][A-Z\s]{2,30})$',
-        # Title case short text that's likely a header
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,4})$',
-    ]
-    
     text = text.strip()
     
-    # Headers are typically short
-    if len(text) > 100:
+    # Cheap prefilter: headers are typically short and every pattern
+    # starts with an uppercase letter or a digit. Most paragraphs are
+    # long prose, so this skips the regex work entirely for them.
+    if len(text) > 100 or len(text) < 2:
         return None
     
-    for pattern in patterns:
-        match = re.match(pattern, text)
+    first_char = text[0]
+    if not first_char.isupper() and not first_char.isdigit():
+        return None
+    
+    for match_header in _HEADER_MATCHERS:
+        match = match_header(text)
         if match:
             return match.group(1).strip()
     
@@ -162,9 +204,13 @@ def parse_pdf_to_document(
     section_index = 0
     paragraph_index = 0
     
+    # Bind hot helpers to locals to avoid global lookups in the loop
+    detect_header = detect_section_header
+    make_paragraph_id = generate_paragraph_id
+    
     for para_text in paragraphs:
         # Check if this looks like a section header
-        header = detect_section_header(para_text)
+        header = detect_header(para_text)
         
         if header and current_paragraphs:
             # Save current section and start new one
@@ -181,7 +227,7 @@ def parse_pdf_to_document(
             current_section_title = header
         else:
             # Regular paragraph
-            para_id = generate_paragraph_id(section_index, paragraph_index)
+            para_id = make_paragraph_id(section_index, paragraph_index)
             current_paragraphs.append(Paragraph(
                 paragraph_id=para_id,
                 text=para_text,
@@ -294,6 +340,61 @@ def search_paragraphs(
 # Equation Extraction
 # =============================================================================
 
+# Patterns for equation detection in academic papers
+# Pattern 1: Explicit numbered equations like "Attention(Q,K,V) = softmax(QK^T/√d_k)V"
+# Pattern 2: Inline math with special symbols: ∑, ∏, √, etc.
+# Pattern 3: Expressions with subscripts/superscripts indicators
+
+# Common equation patterns in the Attention paper format
+EQUATION_PATTERNS = [
+    # Softmax and attention formulas
+    r'(Attention\s*\([^)]+\)\s*=\s*[^\n]+)',
+    # Multi-head attention formula
+    r'(MultiHead\s*\([^)]+\)\s*=\s*[^\n]+)',
+    # Concatenation expressions
+    r'(head_?i\s*=\s*[^\n]+)',
+    # Generic formulas with equals sign and math symbols
+    r'([A-Z][a-z]*\s*\([^)]+\)\s*=\s*softmax\s*\([^)]+\)[^\n]*)',
+    # FFN formulas
+    r'(FFN\s*\([^)]+\)\s*=\s*[^\n]+)',
+    # Layer norm expressions
+    r'(LayerNorm\s*\([^)]+\))',
+    # Positional encoding formulas
+    r'(PE\s*\([^)]+\)\s*=\s*[^\n]+)',
+    # Generic expressions with sqrt symbol
+    r'([^.]*√[^.]+)',
+]
+
+# Literal that every match of the corresponding EQUATION_PATTERNS entry
+# contains, checked against the lowercased text before running the regex
+_EQUATION_PATTERN_GUARDS = ('=', '=', '=', 'softmax', '=', 'layernorm', '=', '√')
+
+# Compile patterns once at import (order matters for equation numbering)
+_EQUATION_PATTERNS = tuple(
+    (guard, re.compile(pattern, re.IGNORECASE))
+    for guard, pattern in zip(_EQUATION_PATTERN_GUARDS, EQUATION_PATTERNS, strict=True)
+)
+
+
+def _may_contain_equation(text: str) -> bool:
+    """Check whether any equation pattern could match the text.
+    
+    Every pattern in EQUATION_PATTERNS requires an "=" sign, a "√" symbol
+    or a LayerNorm call, so a few literal scans rule out most prose.
+    
+    Args:
+        text: The paragraph text to check
+        
+    Returns:
+        False if no equation pattern can match, True otherwise
+    """
+    return '=' in text or '√' in text or 'layernorm' in text.lower()
+
+
+# Precomputed IDs for the first equations; papers rarely exceed this many
+_EQ_ID_CACHE = tuple(f"eq{i}" for i in range(1, 1001))
+
+
 def generate_equation_id(equation_index: int) -> str:
     """Generate a stable equation ID.
     
@@ -303,65 +404,48 @@ def generate_equation_id(equation_index: int) -> str:
     Returns:
         Equation ID like "eq1" (1-indexed for readability)
     """
+    if 0 <= equation_index < len(_EQ_ID_CACHE):
+        return _EQ_ID_CACHE[equation_index]
     return f"eq{equation_index + 1}"
 
 
-def extract_equations_from_text(
+def _extract_equations_into(
     text: str,
     paragraph_id: str,
-    start_equation_index: int = 0,
-) -> tuple[list[Equation], str, int]:
-    """Extract equations from paragraph text.
+    equation_index: int,
+    out_equations: list[Equation],
+    out_refs: list[str],
+) -> int:
+    """Append equations found in text to caller-provided lists.
     
-    Detects common equation patterns in academic papers:
-    - Explicit equation markers: "Equation 1:", "(1)", etc.
-    - Mathematical expressions with special characters
-    - Inline formulas with variables and operators
-    
-    The original equation text is preserved EXACTLY - no simplification.
+    Shared by extract_equations_from_text and
+    extract_equations_from_document so bulk ingestion writes straight
+    into the document's lists without per-paragraph temporaries.
     
     Args:
         text: The paragraph text to extract equations from
         paragraph_id: ID of the source paragraph
-        start_equation_index: Starting index for equation IDs
+        equation_index: Index to use for the next equation ID
+        out_equations: List to append Equation objects to
+        out_refs: List to append equation IDs to
         
     Returns:
-        Tuple of (list of Equation objects, cleaned text, next equation index)
+        Next equation index
     """
-    equations = []
-    equation_refs = []
-    current_index = start_equation_index
-    
-    # Patterns for equation detection in academic papers
-    # Pattern 1: Explicit numbered equations like "Attention(Q,K,V) = softmax(QK^T/√d_k)V"
-    # Pattern 2: Inline math with special symbols: ∑, ∏, √, etc.
-    # Pattern 3: Expressions with subscripts/superscripts indicators
-    
-    # Common equation patterns in the Attention paper format
-    equation_patterns = [
-        # Softmax and attention formulas
-        r'(Attention\s*\([^)]+\)\s*=\s*[^\n]+)',
-        # Multi-head attention formula
-        r'(MultiHead\s*\([^)]+\)\s*=\s*[^\n]+)',
-        # Concatenation expressions
-        r'(head_?i\s*=\s*[^\n]+)',
-        # Generic formulas with equals sign and math symbols
-        r'([A-Z][a-z]*\s*\([^)]+\)\s*=\s*softmax\s*\([^)]+\)[^\n]*)',
-        # FFN formulas
-        r'(FFN\s*\([^)]+\)\s*=\s*[^\n]+)',
-        # Layer norm expressions
-        r'(LayerNorm\s*\([^)]+\))',
-        # Positional encoding formulas
-        r'(PE\s*\([^)]+\)\s*=\s*[^\n]+)',
-        # Generic expressions with sqrt symbol
-        r'([^.]*√[^.]+)',
-    ]
-    
-    cleaned_text = text
-    
-    for pattern in equation_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+    # Most paragraphs contain no equations: skip the regex passes for them
+    if not _may_contain_equation(text):
+        return equation_index
+    
+    seen_texts: set[str] = set()
+    text_lower = text.lower()
+    
+    for guard, pattern in _EQUATION_PATTERNS:
+        # Skip patterns whose required literal is absent; the unanchored √
+        # pattern in particular backtracks across the whole paragraph
+        if guard not in text_lower:
+            continue
+        
+        for match in pattern.finditer(text):
             eq_text = match.group(1).strip()
             
             # Skip if too short or already captured
@@ -369,19 +453,53 @@ def extract_equations_from_text(
                 continue
             
             # Check if this equation text is already captured
-            already_captured = any(eq.equation_text == eq_text for eq in equations)
-            if already_captured:
+            if eq_text in seen_texts:
                 continue
+            seen_texts.add(eq_text)
             
-            eq_id = generate_equation_id(current_index)
-            equations.append(Equation(
+            eq_id = generate_equation_id(equation_index)
+            out_equations.append(Equation(
                 equation_id=eq_id,
                 equation_text=eq_text,
                 associated_paragraph_id=paragraph_id,
             ))
-            equation_refs.append(eq_id)
-            current_index += 1
+            out_refs.append(eq_id)
+            equation_index += 1
+    
+    return equation_index
+
+
+def extract_equations_from_text(
+    text: str,
+    paragraph_id: str,
+    start_equation_index: int = 0,
+) -> tuple[list[Equation], str, int]:
+    """Extract equations from paragraph text.
+    
+    Detects common equation patterns in academic papers:
+    - Explicit equation markers: "Equation 1:", "(1)", etc.
+    - Mathematical expressions with special characters
+    - Inline formulas with variables and operators
     
+    The original equation text is preserved EXACTLY - no simplification.
+    
+    Args:
+        text: The paragraph text to extract equations from
+        paragraph_id: ID of the source paragraph
+        start_equation_index: Starting index for equation IDs
+        
+    Returns:
+        Tuple of (list of Equation objects, cleaned text, next equation index)
+    """
+    equations = []
+    equation_refs = []
+    current_index = _extract_equations_into(
+        text,
+        paragraph_id,
+        start_equation_index,
+        equations,
+        equation_refs,
+    )
     return equations, equation_refs, current_index
 
 
@@ -403,17 +521,65 @@ def extract_equations_from_document(document: Document) -> list[Equation]:
     
     for section in document.sections:
         for para in section.paragraphs:
-            equations, eq_refs, equation_index = extract_equations_from_text(
+            equation_index = _extract_equations_into(
                 para.text,
                 para.paragraph_id,
                 equation_index,
+                all_equations,
+                para.equation_refs,
             )
-            all_equations.extend(equations)
-            para.equation_refs.extend(eq_refs)
     
     return all_equations
 
 
+# Separator between equation texts in the search blob; never part of a query.
+_EQUATION_BLOB_SEP = "\x00"
+
+
+def _get_equation_search_blob(
+    document: Document,
+    case_sensitive: bool,
+) -> tuple[str, list[int], list[str]]:
+    """Get (building if needed) the joined equation text used for search.
+    
+    All equation texts are concatenated with a separator so a query can be
+    located with repeated str.find calls instead of a per-equation loop.
+    The blob is cached on the document together with a copy of the
+    equation list it was built from, and rebuilt when any equation is
+    added, removed or replaced. Equations are frozen, so comparing the
+    copy (an identity check per element, in C) is enough to validate it.
+    
+    Args:
+        document: Document whose equations are searched
+        case_sensitive: Whether to build the blob from the raw or lowercased text
+        
+    Returns:
+        Tuple of (blob, start offset of each equation, equation IDs)
+    """
+    equations = document.equations
+    cached = document._equation_search_cache.get(case_sensitive)
+    if cached is not None and cached[0] == equations:
+        return cached[1]
+    
+    if case_sensitive:
+        texts = [eq.equation_text for eq in equations]
+    else:
+        texts = [eq.equation_text_lower for eq in equations]
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    
+    blob_entry = (
+        _EQUATION_BLOB_SEP.join(texts),
+        starts,
+        [eq.equation_id for eq in equations],
+    )
+    document._equation_search_cache[case_sensitive] = (list(equations), blob_entry)
+    return blob_entry
+
+
 def search_equations(
     document: Document,
     query: str,
@@ -432,11 +598,28 @@ def search_equations(
     if not case_sensitive:
         query = query.lower()
     
-    matching_ids = []
+    if not query or _EQUATION_BLOB_SEP in query:
+        if case_sensitive:
+            return [
+                eq.equation_id for eq in document.equations
+                if query in eq.equation_text
+            ]
+        return [
+            eq.equation_id for eq in document.equations
+            if query in eq.equation_text_lower
+        ]
     
-    for eq in document.equations:
-        text = eq.equation_text if case_sensitive else eq.equation_text.lower()
-        if query in text:
-            matching_ids.append(eq.equation_id)
+    blob, starts, equation_ids = _get_equation_search_blob(document, case_sensitive)
+    
+    matching_ids = []
+    find = blob.find
+    position = find(query)
+    while position != -1:
+        index = bisect.bisect_right(starts, position) - 1
+        matching_ids.append(equation_ids[index])
+        # Skip the rest of this equation so each one is reported once
+        if index + 1 >= len(starts):
+            break
+        position = find(query, starts[index + 1])
     
     return matching_ids
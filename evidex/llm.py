@@ -6,23 +6,59 @@ implementation for testing without external API calls.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
 import json
 import logging
-import re
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Serialized once; returned by MockLLM when no response is configured
+_NOT_FOUND_RESPONSE = json.dumps({
+    "answer": "Not defined in the paper",
+    "citations": [],
+    "confidence": "high"
+})
+
 
 # =============================================================================
 # JSON Extraction Helpers
 # =============================================================================
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Parse with orjson when the optional "fast" extra is installed; it is
+# several times faster than the stdlib. orjson rejects some input the
+# stdlib accepts (NaN, Infinity, lone surrogates), so rejected text is
+# retried with json.loads and results match the stdlib backend, except
+# that integers beyond 64 bits decode as floats. orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so the except clauses below handle
+# both backends.
+def _orjson_loads(text: str) -> object:
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+_json_loads = _orjson_loads if orjson is not None else json.loads
+
+
 def extract_json_block(text: str) -> str:
-    """Extract first balanced JSON object from text using stack-based parsing.
+    """Extract first balanced JSON object from text.
     
-    This is more robust than regex for nested JSON structures like
-    objects containing arrays.
+    The object is first located with json.JSONDecoder.raw_decode, which
+    scans in C. If the text at the first brace is not valid JSON, falls
+    back to a brace-depth scan that is more forgiving than a strict
+    decode and more robust than regex for nested structures.
     
     Args:
         text: Text potentially containing a JSON object
@@ -37,7 +73,13 @@ def extract_json_block(text: str) -> str:
     if start == -1:
         raise ValueError("No JSON object found in text")
     
-    stack = []
+    try:
+        _, end = _JSON_DECODER.raw_decode(text, start)
+        return text[start:end]
+    except json.JSONDecodeError:
+        pass
+    
+    depth = 0
     in_string = False
     escape_next = False
     
@@ -54,67 +96,73 @@ def extract_json_block(text: str) -> str:
             continue
         
         # Handle string boundaries
-        if ch == '"' and not escape_next:
+        if ch == '"':
             in_string = not in_string
             continue
         
         # Only count braces outside strings
         if not in_string:
             if ch == '{':
-                stack.append('{')
+                depth += 1
             elif ch == '}':
-                if not stack:
+                if depth == 0:
                     raise ValueError("Unbalanced JSON braces - extra closing brace")
-                stack.pop()
-                if not stack:
+                depth -= 1
+                if depth == 0:
                     return text[start:i+1]
     
     raise ValueError("Unbalanced JSON braces - unclosed object")
 
 
-def safe_parse_json(content: str) -> dict:
-    """Parse JSON from LLM response with fallback to extraction.
+def _extract_json_payload(content: str) -> tuple[str, dict]:
+    """Locate and parse the JSON payload in an LLM response.
     
-    Tries direct parsing first, then falls back to extracting
-    the first balanced JSON block if the content contains extra text.
+    Tries direct parsing first, then markdown code fences, then the
+    first balanced JSON block.
     
     Args:
         content: LLM response content
         
     Returns:
-        Parsed dict
+        Tuple of (JSON text that was parsed, parsed dict)
         
     Raises:
         ValueError: If no valid JSON can be extracted
     """
     content = content.strip()
     
-    # Try direct parse first (fastest path)
-    try:
-        return json.loads(content)
-    except json.JSONDecodeError:
-        pass
+    # Try direct parse first (fastest path). Content that does not end in a
+    # closing bracket cannot be a complete JSON document, so skip the
+    # doomed parse and go straight to extraction.
+    if content.endswith(('}', ']')):
+        try:
+            return content, _json_loads(content)
+        except json.JSONDecodeError:
+            pass
     
-    # Handle markdown code blocks
-    if '```json' in content:
-        match = re.search(r'```json\s*\n?(.*?)\n?```', content, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(1).strip())
-            except json.JSONDecodeError:
-                pass
-    elif '```' in content:
-        match = re.search(r'```\s*\n?(.*?)\n?```', content, re.DOTALL)
-        if match:
+    # Handle markdown code blocks. The delimiters are literal, so locate
+    # them with str.find rather than a regex.
+    fence_start = content.find('```json')
+    if fence_start != -1:
+        fence_start += len('```json')
+    else:
+        fence_start = content.find('```')
+        if fence_start != -1:
+            fence_start += len('```')
+    
+    if fence_start != -1:
+        fence_end = content.find('```', fence_start)
+        if fence_end != -1:
+            json_str = content[fence_start:fence_end].strip()
             try:
-                return json.loads(match.group(1).strip())
+                return json_str, _json_loads(json_str)
             except json.JSONDecodeError:
                 pass
     
     # Fall back to balanced-braces extraction
     try:
         json_str = extract_json_block(content)
-        return json.loads(json_str)
+        return json_str, _json_loads(json_str)
     except (ValueError, json.JSONDecodeError) as e:
         raise ValueError(
             f"Could not parse LLM response as JSON: {content[:200]}... "
@@ -122,6 +170,46 @@ def safe_parse_json(content: str) -> dict:
         )
 
 
+def safe_parse_json(content: str) -> dict:
+    """Parse JSON from LLM response with fallback to extraction.
+    
+    Tries direct parsing first, then falls back to extracting
+    the first balanced JSON block if the content contains extra text.
+    
+    Args:
+        content: LLM response content
+        
+    Returns:
+        Parsed dict
+        
+    Raises:
+        ValueError: If no valid JSON can be extracted
+    """
+    return _extract_json_payload(content)[1]
+
+
+# Located JSON payloads of responses that needed fence or brace extraction,
+# keyed on the full response content. Direct JSON responses are not stored:
+# for them the payload is the content itself and a hit would save nothing.
+_PAYLOAD_CACHE_SIZE = 128
+_payload_cache: OrderedDict[str, str] = OrderedDict()
+_payload_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _encode_response(answer: str, citations: tuple[str, ...], confidence: str) -> str:
+    """Serialize an answer payload, memoized on its fields.
+    
+    Backs MockLLM.create_response, which tests call with the same few
+    payloads over and over.
+    """
+    return json.dumps({
+        "answer": answer,
+        "citations": list(citations),
+        "confidence": confidence
+    })
+
+
 @dataclass
 class LLMResponse:
     """Raw response from an LLM.
@@ -152,6 +240,23 @@ class LLMInterface(ABC):
             LLMResponse containing the generated text
         """
         pass
+    
+    def generate_messages(self, messages: list[dict]) -> LLMResponse:
+        """Generate a response for a prompt split into chat messages.
+        
+        Callers split the prompt so the static system prompt and the
+        per-document context come before the question. Providers that
+        support role-separated messages can forward them and benefit from
+        prefix caching; the default joins the contents into a single
+        prompt, which is identical to the unsplit prompt.
+        
+        Args:
+            messages: List of {"role": ..., "content": ...} dicts
+            
+        Returns:
+            LLMResponse containing the generated text
+        """
+        return self.generate("".join(message["content"] for message in messages))
 
 
 class MockLLM(LLMInterface):
@@ -178,6 +283,11 @@ class MockLLM(LLMInterface):
         """
         self.default_response = default_response or self._not_found_response()
         self.keyword_responses = keyword_responses or {}
+        # Keywords lowercased once here rather than on every generate call
+        self._lowered_keyword_responses = [
+            (keyword.lower(), response)
+            for keyword, response in self.keyword_responses.items()
+        ]
         self.call_history: list[str] = []
     
     def generate(self, prompt: str) -> LLMResponse:
@@ -193,22 +303,20 @@ class MockLLM(LLMInterface):
         """
         self.call_history.append(prompt)
         
-        # Check for keyword matches
-        prompt_lower = prompt.lower()
-        for keyword, response in self.keyword_responses.items():
-            if keyword.lower() in prompt_lower:
-                return LLMResponse(content=response)
+        # Check for keyword matches. Each probe is a C-level substring
+        # search; fixed-response mocks skip lowercasing the prompt entirely.
+        if self._lowered_keyword_responses:
+            prompt_lower = prompt.lower()
+            for keyword, response in self._lowered_keyword_responses:
+                if keyword in prompt_lower:
+                    return LLMResponse(content=response)
         
         return LLMResponse(content=self.default_response)
     
     @staticmethod
     def _not_found_response() -> str:
         """Default response indicating information not found."""
-        return json.dumps({
-            "answer": "Not defined in the paper",
-            "citations": [],
-            "confidence": "high"
-        })
+        return _NOT_FOUND_RESPONSE
     
     @staticmethod
     def create_response(
@@ -226,11 +334,107 @@ class MockLLM(LLMInterface):
         Returns:
             JSON string in expected format
         """
-        return json.dumps({
-            "answer": answer,
-            "citations": citations,
-            "confidence": confidence
-        })
+        return _encode_response(answer, tuple(citations), confidence)
+
+
+class CachedLLM(LLMInterface):
+    """Exact-match response cache around another LLM.
+    
+    Identical prompts (retries, repeated questions about the same
+    paragraphs) are answered from memory instead of another provider
+    round trip. Prompts are keyed by their SHA-256 digest so the cache
+    does not pin every prompt string; the least recently used entries
+    are evicted once maxsize is reached.
+    
+    Only wrap deterministic LLMs (temperature 0): a cache hit replays the
+    first response verbatim. Cached LLMResponse objects are shared
+    between callers and must not be mutated.
+    """
+    
+    def __init__(self, llm: LLMInterface, maxsize: int = 256):
+        """Initialize the cache.
+        
+        Args:
+            llm: The LLM that answers cache misses
+            maxsize: Maximum number of responses kept
+        """
+        self.llm = llm
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._responses: OrderedDict[str, LLMResponse] = OrderedDict()
+        # explain_questions_concurrent calls the LLM from worker threads
+        self._lock = threading.Lock()
+    
+    def generate(self, prompt: str) -> LLMResponse:
+        """Return the cached response for prompt, or ask the wrapped LLM.
+        
+        Args:
+            prompt: The full prompt to send to the LLM
+            
+        Returns:
+            LLMResponse containing the generated text
+        """
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        return self._cached(key, lambda: self.llm.generate(prompt))
+    
+    def generate_messages(self, messages: list[dict]) -> LLMResponse:
+        """Return the cached response for messages, or ask the wrapped LLM.
+        
+        Roles are part of the key, so the same text split differently
+        into messages is a separate entry.
+        
+        Args:
+            messages: List of {"role": ..., "content": ...} dicts
+            
+        Returns:
+            LLMResponse containing the generated text
+        """
+        digest = hashlib.sha256()
+        for message in messages:
+            digest.update(message["role"].encode())
+            digest.update(b"\0")
+            digest.update(message["content"].encode())
+            digest.update(b"\0")
+        key = "messages:" + digest.hexdigest()
+        return self._cached(key, lambda: self.llm.generate_messages(messages))
+    
+    def _cached(self, key: str, call) -> LLMResponse:
+        """Look up key, calling the wrapped LLM and storing the result on a miss.
+        
+        The lock is not held during the provider call, so concurrent
+        misses on the same key may each reach the wrapped LLM once.
+        
+        Args:
+            key: Cache key for the request
+            call: Zero-argument callable that performs the request
+            
+        Returns:
+            LLMResponse containing the generated text
+        """
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+                self.hits += 1
+                return response
+            self.misses += 1
+        
+        response = call()
+        
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+        return response
+    
+    def clear(self) -> None:
+        """Drop all cached responses and reset the hit/miss counters."""
+        with self._lock:
+            self._responses.clear()
+            self.hits = 0
+            self.misses = 0
 
 
 def parse_llm_response(response: LLMResponse) -> dict:
@@ -251,7 +455,59 @@ def parse_llm_response(response: LLMResponse) -> dict:
     Raises:
         ValueError: If response cannot be parsed
     """
-    return safe_parse_json(response.content)
+    content = response.content
+    
+    # Deterministic LLMs repeat the same wrapped content, so a hit skips
+    # the fence and brace scanning and only parses the located payload.
+    with _payload_cache_lock:
+        json_str = _payload_cache.get(content)
+        if json_str is not None:
+            _payload_cache.move_to_end(content)
+    if json_str is not None:
+        return _json_loads(json_str)
+    
+    # On a miss the extraction has already parsed the payload; hand that
+    # dict to the caller instead of parsing it a second time
+    json_str, parsed = _extract_json_payload(content)
+    if len(json_str) < len(content.strip()):
+        with _payload_cache_lock:
+            _payload_cache[content] = json_str
+            while len(_payload_cache) > _PAYLOAD_CACHE_SIZE:
+                _payload_cache.popitem(last=False)
+    return parsed
+
+
+def parse_llm_response_batch(response: LLMResponse) -> list[dict]:
+    """Parse a batched LLM response containing a JSON array of answers.
+    
+    The array may be wrapped in markdown code fences or explanatory
+    text; each '[' is tried in turn until one starts a valid JSON array
+    of objects.
+    
+    Args:
+        response: The raw LLM response
+        
+    Returns:
+        List of answer dicts
+        
+    Raises:
+        ValueError: If no JSON array can be parsed from the response
+    """
+    content = response.content
+    start = content.find('[')
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(content, start)
+        except json.JSONDecodeError:
+            parsed = None
+        # Arrays of plain values (e.g. a citations list) are not answers
+        if isinstance(parsed, list) and all(isinstance(item, dict) for item in parsed):
+            return parsed
+        start = content.find('[', start + 1)
+    
+    raise ValueError(
+        f"Could not parse LLM response as JSON array: {content[:200]}..."
+    )
 
 
 class GroqLLM(LLMInterface):
@@ -302,13 +558,45 @@ class GroqLLM(LLMInterface):
             TimeoutError: If request times out
         """
         self.call_history.append(prompt)
+        return self._create_completion([{"role": "user", "content": prompt}])
+    
+    def generate_messages(self, messages: list[dict]) -> LLMResponse:
+        """Generate a response from role-separated chat messages.
+        
+        Sending the system prompt and document context as their own
+        leading messages lets Groq reuse its prompt cache across questions
+        about the same paragraphs.
+        
+        Args:
+            messages: List of {"role": ..., "content": ...} dicts
+            
+        Returns:
+            LLMResponse containing the generated text
+            
+        Raises:
+            RuntimeError: If API call fails or response is malformed
+            TimeoutError: If request times out
+        """
+        self.call_history.append("".join(message["content"] for message in messages))
+        return self._create_completion(messages)
+    
+    def _create_completion(self, messages: list[dict]) -> LLMResponse:
+        """Send chat messages to the Groq API and extract the response.
         
+        Args:
+            messages: List of {"role": ..., "content": ...} dicts
+            
+        Returns:
+            LLMResponse containing the generated text
+            
+        Raises:
+            RuntimeError: If API call fails or response is malformed
+            TimeoutError: If request times out
+        """
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=self.temperature,
                 max_tokens=1024,
             )
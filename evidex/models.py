@@ -5,28 +5,50 @@ These models represent the structure of parsed research documents
 and the responses generated by the system.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Equation:
     """A mathematical equation within a document.
     
     Equations are first-class citizens that must be preserved exactly
-    as they appear in the source document.
+    as they appear in the source document. They are immutable, so the
+    derived search and prompt fields can never go stale; build a new
+    Equation to change one.
     
     Attributes:
         equation_id: Unique identifier for this equation (e.g., "eq1")
         equation_text: The raw equation text/LaTeX (NOT simplified)
         associated_paragraph_id: ID of paragraph where this equation appears
+        equation_text_lower: Lowercased equation_text, cached for searching
+        formatted_block: Entry for this equation in the prompt equations block
     """
     equation_id: str
     equation_text: str
     associated_paragraph_id: str
+    equation_text_lower: str = field(init=False, repr=False, compare=False)
+    formatted_block: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Equation IDs are citation targets like paragraph IDs; intern both
+        # IDs so set and dict lookups hit the identity fast path. The class
+        # is frozen, so derived fields are set through object.__setattr__.
+        object.__setattr__(self, "equation_id", sys.intern(self.equation_id))
+        object.__setattr__(
+            self, "associated_paragraph_id", sys.intern(self.associated_paragraph_id)
+        )
+        object.__setattr__(self, "equation_text_lower", self.equation_text.lower())
+        object.__setattr__(
+            self,
+            "formatted_block",
+            f"[{self.equation_id}] (from {self.associated_paragraph_id})\n{self.equation_text}",
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Entities:
     """Extracted entities from a paragraph.
     
@@ -41,24 +63,33 @@ class Entities:
     concepts: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Motivation:
     """An explicit author motivation extracted from text.
     
     Represents a "why" statement that authors explicitly made,
     identified by trigger phrases like "because", "to address", etc.
+    Immutable, so full_sentence_lower always matches full_sentence.
     
     Attributes:
         text: The motivation statement (the "why")
         trigger_phrase: The phrase that introduced the motivation
         full_sentence: The complete sentence containing the motivation
+        full_sentence_lower: Lowercased full_sentence, cached for searching
     """
     text: str
     trigger_phrase: str
     full_sentence: str
+    full_sentence_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Trigger phrases come from a small fixed vocabulary and are used
+        # as grouping keys, so share one string object per phrase
+        object.__setattr__(self, "trigger_phrase", sys.intern(self.trigger_phrase))
+        object.__setattr__(self, "full_sentence_lower", self.full_sentence.lower())
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """A single paragraph within a document section.
     
@@ -74,9 +105,14 @@ class Paragraph:
     equation_refs: list[str] = field(default_factory=list)
     entities: Entities | None = None
     motivations: list['Motivation'] = field(default_factory=list)
+    
+    def __post_init__(self) -> None:
+        # Paragraph IDs are used as dict keys throughout the pipeline;
+        # interning makes repeated lookups hit the identity fast path
+        self.paragraph_id = sys.intern(self.paragraph_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section of a document containing multiple paragraphs.
     
@@ -88,7 +124,7 @@ class Section:
     paragraphs: list[Paragraph] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """A complete document composed of sections.
     
@@ -100,9 +136,24 @@ class Document:
     title: str
     sections: list[Section] = field(default_factory=list)
     equations: list[Equation] = field(default_factory=list)
+    _equation_search_cache: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _paragraph_index: dict[str, tuple[int, int, Paragraph]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
-    def get_paragraph(self, paragraph_id: str) -> Paragraph | None:
-        """Retrieve a paragraph by its ID.
+    def _find_paragraph(self, paragraph_id: str) -> Paragraph | None:
+        """Look up a paragraph through the cached ID index.
+        
+        The index maps each ID to the paragraph's (section, position) slot.
+        A hit is trusted only if that slot still holds the same object
+        under the same ID, so the check is O(1) and never returns a
+        replaced, removed or renamed paragraph. Anything else falls back
+        to the front-to-back scan, which rebuilds the index when it finds
+        a paragraph the index missed. Paragraph IDs are unique in ingested
+        documents; a duplicate ID inserted ahead of an indexed paragraph
+        is not detected until that slot changes.
         
         Args:
             paragraph_id: The unique identifier of the paragraph
@@ -110,12 +161,73 @@ class Document:
         Returns:
             The Paragraph if found, None otherwise
         """
+        index = self._paragraph_index
+        if index is None:
+            index = self._rebuild_paragraph_index()
+        
+        entry = index.get(paragraph_id)
+        if entry is not None:
+            section_pos, paragraph_pos, paragraph = entry
+            try:
+                current = self.sections[section_pos].paragraphs[paragraph_pos]
+            except IndexError:
+                current = None
+            if current is paragraph and paragraph.paragraph_id == paragraph_id:
+                return paragraph
+        
         for section in self.sections:
             for paragraph in section.paragraphs:
                 if paragraph.paragraph_id == paragraph_id:
+                    # The document changed since the index was built
+                    self._rebuild_paragraph_index()
                     return paragraph
         return None
     
+    def _rebuild_paragraph_index(self) -> dict[str, tuple[int, int, Paragraph]]:
+        """Rebuild and cache the paragraph ID -> slot index.
+        
+        The first paragraph with a given ID wins, matching a front-to-back
+        scan.
+        
+        Returns:
+            Dict mapping paragraph IDs to (section, position, paragraph)
+        """
+        index: dict[str, tuple[int, int, Paragraph]] = {}
+        for section_pos, section in enumerate(self.sections):
+            for paragraph_pos, paragraph in enumerate(section.paragraphs):
+                index.setdefault(
+                    paragraph.paragraph_id, (section_pos, paragraph_pos, paragraph)
+                )
+        self._paragraph_index = index
+        return index
+    
+    def paragraph_key(self) -> tuple[tuple[str, str], ...]:
+        """Build the content key used to memoize per-document results.
+        
+        Caches keyed on this tuple can never go stale: any edit to a
+        paragraph's ID or text, or any added, removed or replaced
+        paragraph, produces a different key.
+        
+        Returns:
+            Tuple of (paragraph_id, text) pairs in document order
+        """
+        return tuple(
+            (para.paragraph_id, para.text)
+            for section in self.sections
+            for para in section.paragraphs
+        )
+    
+    def get_paragraph(self, paragraph_id: str) -> Paragraph | None:
+        """Retrieve a paragraph by its ID.
+        
+        Args:
+            paragraph_id: The unique identifier of the paragraph
+            
+        Returns:
+            The Paragraph if found, None otherwise
+        """
+        return self._find_paragraph(paragraph_id)
+    
     def get_paragraphs(self, paragraph_ids: list[str]) -> list[Paragraph]:
         """Retrieve multiple paragraphs by their IDs.
         
@@ -127,7 +239,7 @@ class Document:
         """
         result = []
         for pid in paragraph_ids:
-            para = self.get_paragraph(pid)
+            para = self._find_paragraph(pid)
             if para is not None:
                 result.append(para)
         return result
@@ -192,7 +304,7 @@ class Document:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class QAResponse:
     """Structured response from the Q&A system.
     
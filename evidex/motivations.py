@@ -13,7 +13,12 @@ NOTE: Used to answer "why" questions about author decisions.
 """
 
 import re
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from evidex.models import Document, Paragraph
 
@@ -22,18 +27,28 @@ from evidex.models import Document, Paragraph
 # Motivation Model
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Motivation:
     """An explicit author motivation extracted from text.
     
+    Immutable, so full_sentence_lower always matches full_sentence.
+    
     Attributes:
         text: The motivation statement (the "why")
         trigger_phrase: The phrase that introduced the motivation
         full_sentence: The complete sentence containing the motivation
+        full_sentence_lower: Lowercased full_sentence, cached for searching
     """
     text: str
     trigger_phrase: str
     full_sentence: str
+    full_sentence_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Trigger phrases come from a small fixed vocabulary and are used
+        # as grouping keys, so share one string object per phrase
+        object.__setattr__(self, "trigger_phrase", sys.intern(self.trigger_phrase))
+        object.__setattr__(self, "full_sentence_lower", self.full_sentence.lower())
 
 
 # =============================================================================
@@ -111,9 +126,66 @@ MOTIVATION_TRIGGERS = [
     r'instead of\b',
 ]
 
-# Compile into a single pattern
+
+def _group_triggers_by_first_word(triggers: list[str]) -> str:
+    """Build an alternation that shares each leading word across triggers.
+    
+    "to enable", "to allow", ... become "to (?:enable|allow|...)", so the
+    regex engine tests the common prefix once per position instead of
+    once per trigger. Triggers with the same leading word always differ
+    in the next word, so grouping does not change which trigger matches.
+    
+    Args:
+        triggers: Trigger regexes, each starting with a word or a group
+        
+    Returns:
+        Alternation of the triggers (without an enclosing group)
+    """
+    groups: dict[str, list[str]] = {}
+    for trigger in triggers:
+        head, sep, rest = trigger.partition(' ')
+        if sep and head.isalpha():
+            groups.setdefault(head, []).append(rest)
+        else:
+            groups.setdefault(trigger, [])
+    
+    branches = []
+    for head, rests in groups.items():
+        if not rests:
+            branches.append(head)
+        elif len(rests) == 1:
+            branches.append(f'{head} {rests[0]}')
+        else:
+            branches.append(f'{head} (?:' + '|'.join(rests) + ')')
+    return '|'.join(branches)
+
+
+def _trigger_first_letters(triggers: list[str]) -> str:
+    """Collect the letters any trigger can start with.
+    
+    Args:
+        triggers: Trigger regexes, each starting with a word or a
+            non-capturing group of words
+            
+    Returns:
+        Sorted lowercase letters, suitable for a character class
+    """
+    letters = set()
+    for trigger in triggers:
+        if trigger.startswith('(?:'):
+            alternatives = trigger[3:trigger.index(')')].split('|')
+        else:
+            alternatives = [trigger]
+        letters.update(alternative[0].lower() for alternative in alternatives)
+    return ''.join(sorted(letters))
+
+
+# Compile into a single pattern. Triggers must start on a word boundary
+# with one of a few letters, which lets the engine reject most positions
+# (mid-word characters, other words) before trying any branch.
 _TRIGGER_PATTERN = re.compile(
-    r'(' + '|'.join(MOTIVATION_TRIGGERS) + r')',
+    r'\b(?=[' + _trigger_first_letters(MOTIVATION_TRIGGERS) + r'])'
+    r'(' + _group_triggers_by_first_word(MOTIVATION_TRIGGERS) + r')',
     re.IGNORECASE
 )
 
@@ -125,18 +197,40 @@ _SENTENCE_PATTERN = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
 # Extraction Functions
 # =============================================================================
 
-def _split_sentences(text: str) -> list[str]:
-    """Split text into sentences.
+def _sentence_bounds(text: str) -> tuple[list[int], list[int]]:
+    """Find the start and end offsets of each sentence in text.
     
     Args:
         text: The text to split
         
     Returns:
-        List of sentences
+        Tuple of (sentence start offsets, sentence end offsets)
+    """
+    starts = [0]
+    ends = []
+    for separator in _SENTENCE_PATTERN.finditer(text):
+        ends.append(separator.start())
+        starts.append(separator.end())
+    ends.append(len(text))
+    return starts, ends
+
+
+@lru_cache(maxsize=4096)
+def _first_trigger_offset(text: str) -> int:
+    """Find where the first motivation trigger in text starts.
+    
+    Memoized so has_motivation and extract_motivations share one scan per
+    distinct text, and repeated document-level passes skip paragraphs
+    already known to have no triggers.
+    
+    Args:
+        text: The text to scan
+        
+    Returns:
+        Offset of the first trigger, or -1 if there is none
     """
-    # Simple sentence splitting
-    sentences = _SENTENCE_PATTERN.split(text)
-    return [s.strip() for s in sentences if s.strip()]
+    match = _TRIGGER_PATTERN.search(text)
+    return match.start() if match else -1
 
 
 def extract_motivations(text: str) -> list[Motivation]:
@@ -154,37 +248,43 @@ def extract_motivations(text: str) -> list[Motivation]:
     Returns:
         List of Motivation objects found
     """
+    first_trigger = _first_trigger_offset(text)
+    if first_trigger == -1:
+        return []
+    
     motivations = []
-    sentences = _split_sentences(text)
+    sentence_starts, sentence_ends = _sentence_bounds(text)
     
-    for sentence in sentences:
-        # Find all trigger phrases in this sentence
-        matches = list(_TRIGGER_PATTERN.finditer(sentence))
+    # Scan the whole text once. Triggers never contain sentence-ending
+    # punctuation, so each match lies inside a single sentence, which is
+    # then located by binary search over the sentence offsets.
+    for match in _TRIGGER_PATTERN.finditer(text, first_trigger):
+        index = bisect_right(sentence_starts, match.start()) - 1
+        sentence_end = sentence_ends[index]
+        trigger = match.group(1).lower().strip()
         
-        for match in matches:
-            trigger = match.group(1).lower().strip()
-            
-            # Extract the motivation text (what comes after the trigger)
-            start_pos = match.end()
-            motivation_text = sentence[start_pos:].strip()
-            
-            # Clean up: remove leading punctuation/whitespace
-            motivation_text = re.sub(r'^[,\s]+', '', motivation_text)
-            
-            # Skip if motivation text is too short or empty
-            if len(motivation_text) < 10:
-                continue
-            
-            # Truncate at next sentence boundary within the text
-            period_pos = motivation_text.find('.')
-            if period_pos > 0:
-                motivation_text = motivation_text[:period_pos + 1]
-            
-            motivations.append(Motivation(
-                text=motivation_text.strip(),
-                trigger_phrase=trigger,
-                full_sentence=sentence.strip(),
-            ))
+        # Extract the motivation text (what comes after the trigger)
+        motivation_text = text[match.end():sentence_end].strip()
+        
+        # Clean up: remove leading punctuation/whitespace. The text is
+        # already stripped, so only leading commas need handling.
+        while motivation_text.startswith(','):
+            motivation_text = motivation_text[1:].lstrip()
+        
+        # Skip if motivation text is too short or empty
+        if len(motivation_text) < 10:
+            continue
+        
+        # Truncate at next sentence boundary within the text
+        period_pos = motivation_text.find('.')
+        if period_pos > 0:
+            motivation_text = motivation_text[:period_pos + 1]
+        
+        motivations.append(Motivation(
+            text=motivation_text.strip(),
+            trigger_phrase=trigger,
+            full_sentence=text[sentence_starts[index]:sentence_end].strip(),
+        ))
     
     return motivations
 
@@ -220,7 +320,7 @@ def has_motivation(text: str) -> bool:
     Returns:
         True if at least one motivation trigger is found
     """
-    return bool(_TRIGGER_PATTERN.search(text))
+    return _first_trigger_offset(text) != -1
 
 
 # =============================================================================
@@ -239,24 +339,63 @@ def extract_motivations_for_paragraph(paragraph: Paragraph) -> list[Motivation]:
     return extract_motivations(paragraph.text)
 
 
+@lru_cache(maxsize=32)
+def _extract_motivations_cached(
+    paragraphs: tuple[tuple[str, str], ...],
+) -> dict[str, list[Motivation]]:
+    """Extract motivations for a document's (paragraph_id, text) pairs.
+    
+    Keyed on paragraph content rather than the Document object, so an
+    edited document is never served stale results.
+    
+    Args:
+        paragraphs: Tuple of (paragraph_id, text) pairs in document order
+        
+    Returns:
+        Dict mapping paragraph_id to list of Motivation objects
+    """
+    result = {}
+    
+    for paragraph_id, text in paragraphs:
+        motivations = extract_motivations(text)
+        if motivations:
+            result[paragraph_id] = motivations
+    
+    return result
+
+
 def extract_motivations_for_document(document: Document) -> dict[str, list[Motivation]]:
     """Extract motivations from all paragraphs in a document.
     
+    Results are memoized per document content, so repeated searches and
+    summaries over the same document skip re-extraction.
+    
     Args:
         document: The document to process
         
     Returns:
         Dict mapping paragraph_id to list of Motivation objects
     """
-    result = {}
+    cached = _extract_motivations_cached(document.paragraph_key())
+    # Copy the containers so callers cannot mutate the cached entry
+    return {paragraph_id: list(motivations) for paragraph_id, motivations in cached.items()}
+
+
+def _iter_motivations(document: Document) -> Iterator[tuple[str, Motivation]]:
+    """Yield (paragraph_id, Motivation) pairs for a document in order.
     
-    for section in document.sections:
-        for para in section.paragraphs:
-            motivations = extract_motivations(para.text)
-            if motivations:
-                result[para.paragraph_id] = motivations
+    Reads the memoized extraction directly, without the defensive copy
+    extract_motivations_for_document makes for external callers.
     
-    return result
+    Args:
+        document: The document to process
+        
+    Yields:
+        (paragraph_id, Motivation) tuples
+    """
+    for para_id, motivations in _extract_motivations_cached(document.paragraph_key()).items():
+        for m in motivations:
+            yield para_id, m
 
 
 def search_motivations(document: Document, keyword: str) -> list[tuple[str, Motivation]]:
@@ -273,16 +412,104 @@ def search_motivations(document: Document, keyword: str) -> list[tuple[str, Moti
         List of (paragraph_id, Motivation) tuples
     """
     keyword_lower = keyword.lower()
-    results = []
     
-    motivations_by_para = extract_motivations_for_document(document)
+    return [
+        (para_id, m) for para_id, m in _iter_motivations(document)
+        if keyword_lower in m.full_sentence_lower
+    ]
+
+
+# Word tokens used to index motivation sentences
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+class MotivationIndex:
+    """Word index over a document's motivations for repeated searches.
+    
+    Motivations are extracted once and their sentences indexed by
+    lowercase word, so each search is a dict lookup rather than a scan
+    over every motivation. Unlike search_motivations, which matches any
+    substring, keywords match whole words; multi-word keywords must
+    appear as a phrase.
     
-    for para_id, motivations in motivations_by_para.items():
-        for m in motivations:
-            if keyword_lower in m.full_sentence.lower():
-                results.append((para_id, m))
+    Use get_motivation_index() to share one index per document content.
+    """
+    
+    def __init__(self, motivations_by_para: dict[str, list[Motivation]]):
+        """Build the index from extracted motivations.
+        
+        Args:
+            motivations_by_para: Output of extract_motivations_for_document
+        """
+        self._entries: list[tuple[str, Motivation]] = []
+        self._by_token: dict[str, list[int]] = {}
+        
+        for para_id, motivations in motivations_by_para.items():
+            for m in motivations:
+                entry_index = len(self._entries)
+                self._entries.append((para_id, m))
+                for token in set(_TOKEN_PATTERN.findall(m.full_sentence_lower)):
+                    self._by_token.setdefault(token, []).append(entry_index)
+    
+    def __len__(self) -> int:
+        """Return the number of indexed motivations."""
+        return len(self._entries)
+    
+    def search(self, keyword: str) -> list[tuple[str, Motivation]]:
+        """Find motivations whose sentence contains the keyword as words.
+        
+        Args:
+            keyword: Word or phrase to search for (case-insensitive)
+            
+        Returns:
+            List of (paragraph_id, Motivation) tuples in document order
+        """
+        keyword_lower = keyword.lower()
+        tokens = _TOKEN_PATTERN.findall(keyword_lower)
+        if not tokens:
+            return []
+        
+        # Intersect postings, starting from the rarest token
+        postings = sorted(
+            (self._by_token.get(token, []) for token in set(tokens)),
+            key=len,
+        )
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            posting_set = set(posting)
+            candidates = [i for i in candidates if i in posting_set]
+        
+        if len(tokens) == 1:
+            return [self._entries[i] for i in candidates]
+        
+        # Multi-word keywords must also appear as a phrase
+        return [
+            self._entries[i] for i in candidates
+            if keyword_lower in self._entries[i][1].full_sentence_lower
+        ]
+
+
+@lru_cache(maxsize=32)
+def _motivation_index_cached(paragraphs: tuple[tuple[str, str], ...]) -> MotivationIndex:
+    """Build a MotivationIndex for a document content key."""
+    return MotivationIndex(_extract_motivations_cached(paragraphs))
+
+
+def get_motivation_index(document: Document) -> MotivationIndex:
+    """Get the shared MotivationIndex for a document.
     
-    return results
+    The index is memoized on paragraph content, so repeated calls for an
+    unchanged document return the same index.
+    
+    Args:
+        document: The document to index
+        
+    Returns:
+        MotivationIndex for the document
+    """
+    return _motivation_index_cached(document.paragraph_key())
 
 
 def get_motivation_summary(document: Document) -> dict:
@@ -294,22 +521,21 @@ def get_motivation_summary(document: Document) -> dict:
     Returns:
         Dict with summary statistics and motivations grouped by trigger
     """
-    all_motivations = extract_motivations_for_document(document)
+    # Read the memoized extraction directly; only the summary is returned,
+    # so the per-paragraph copy is not needed
+    all_motivations = _extract_motivations_cached(document.paragraph_key())
     
     # Group by trigger phrase
-    by_trigger: dict[str, list[str]] = {}
+    by_trigger: defaultdict[str, list[str]] = defaultdict(list)
     total_count = 0
     
-    for para_id, motivations in all_motivations.items():
+    for motivations in all_motivations.values():
+        total_count += len(motivations)
         for m in motivations:
-            trigger = m.trigger_phrase
-            if trigger not in by_trigger:
-                by_trigger[trigger] = []
-            by_trigger[trigger].append(m.text)
-            total_count += 1
+            by_trigger[m.trigger_phrase].append(m.text)
     
     return {
         "total_motivations": total_count,
         "paragraphs_with_motivations": len(all_motivations),
-        "by_trigger": by_trigger,
+        "by_trigger": dict(by_trigger),
     }
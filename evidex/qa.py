@@ -5,8 +5,24 @@ This module provides the core explain_question function that answers
 questions using ONLY the content from the provided document paragraphs.
 """
 
+import asyncio
+
 from evidex.models import Document, Paragraph, Equation, QAResponse
-from evidex.llm import LLMInterface, LLMResponse, parse_llm_response
+from evidex.llm import (
+    LLMInterface,
+    LLMResponse,
+    parse_llm_response,
+    parse_llm_response_batch,
+)
+
+
+# Maximum questions per batched LLM call; answer quality degrades on
+# larger batches, so longer lists are split into several calls
+MAX_BATCH_SIZE = 16
+
+# Default number of questions answered concurrently by
+# explain_questions_concurrent; each one occupies a worker thread
+DEFAULT_MAX_CONCURRENCY = 8
 
 
 # System prompt that strictly forbids external knowledge
@@ -66,6 +82,37 @@ RESPONSE SCHEMA:
 Do not include any text outside the JSON object."""
 
 
+# Static prompt scaffolding, assembled once at import so build_prompt only
+# joins in the per-call context, equations and question
+_PROMPT_DOCUMENT_START = "\n\n=== DOCUMENT CONTENT ===\n"
+
+_PROMPT_HEADER = SYSTEM_PROMPT + _PROMPT_DOCUMENT_START
+
+_PROMPT_CONTEXT_END = "\n=== END DOCUMENT CONTENT ===\n"
+
+_EQUATIONS_HEADER = """
+=== EQUATIONS ===
+The following equations are critical to understanding the document content.
+Do NOT simplify or modify these equations - they must be preserved exactly.
+
+"""
+
+_EQUATIONS_FOOTER = "\n=== END EQUATIONS ===\n"
+
+_PROMPT_TAIL = """
+
+CRITICAL: You MUST respond with valid JSON including citations array.
+
+Example Response Format:
+{
+    "answer": "Your answer summarizing the content from the paragraphs above",
+    "citations": ["s1_p7"],
+    "confidence": "low"
+}
+
+Now provide your response as JSON:"""
+
+
 def build_context_block(paragraphs: list[Paragraph]) -> str:
     """Build a formatted context block from paragraphs.
     
@@ -78,11 +125,20 @@ def build_context_block(paragraphs: list[Paragraph]) -> str:
     if not paragraphs:
         return "No paragraphs provided."
     
-    blocks = []
+    # Append the pieces directly rather than f-string formatting each
+    # block: the paragraph texts are referenced, not copied, until the
+    # single final join.
+    buf = []
+    append = buf.append
     for para in paragraphs:
-        blocks.append(f"[{para.paragraph_id}]\n{para.text}")
+        append("[")
+        append(para.paragraph_id)
+        append("]\n")
+        append(para.text)
+        append("\n\n")
+    buf.pop()  # Trailing separator
     
-    return "\n\n".join(blocks)
+    return "".join(buf)
 
 
 def build_equations_block(equations: list[Equation]) -> str:
@@ -100,11 +156,59 @@ def build_equations_block(equations: list[Equation]) -> str:
     if not equations:
         return ""
     
-    blocks = []
-    for eq in equations:
-        blocks.append(f"[{eq.equation_id}] (from {eq.associated_paragraph_id})\n{eq.equation_text}")
+    # Each equation's entry is formatted once, when the Equation is built,
+    # and reused by every prompt that includes it
+    return "\n\n".join([eq.formatted_block for eq in equations])
+
+
+def build_equations_section(equations_context: str) -> str:
+    """Wrap a formatted equations block in its prompt section markers.
+    
+    Args:
+        equations_context: Formatted equations block (may be empty)
+        
+    Returns:
+        The equations prompt section, or "" if there are no equations
+    """
+    if not equations_context:
+        return ""
     
-    return "\n\n".join(blocks)
+    return _EQUATIONS_HEADER + equations_context + _EQUATIONS_FOOTER
+
+
+def build_prompt_messages(
+    context: str,
+    question: str,
+    equations_context: str = "",
+) -> list[dict]:
+    """Build the LLM prompt as chat messages ordered for prefix caching.
+    
+    The static system prompt comes first, then the document context and
+    equations (stable for a given set of paragraphs), and the question
+    last, so repeated questions share the longest possible prefix.
+    Concatenating the message contents yields exactly build_prompt().
+    
+    Args:
+        context: The formatted paragraph context
+        question: The user's question
+        equations_context: Optional formatted equations block
+        
+    Returns:
+        List of {"role": ..., "content": ...} message dicts
+    """
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": "".join((
+                _PROMPT_DOCUMENT_START,
+                context,
+                _PROMPT_CONTEXT_END,
+                build_equations_section(equations_context),
+            )),
+        },
+        {"role": "user", "content": "".join(("\nQUESTION: ", question, _PROMPT_TAIL))},
+    ]
 
 
 def build_prompt(context: str, question: str, equations_context: str = "") -> str:
@@ -118,36 +222,15 @@ def build_prompt(context: str, question: str, equations_context: str = "") -> st
     Returns:
         Complete prompt string
     """
-    # Build equations section if present
-    equations_section = ""
-    if equations_context:
-        equations_section = f"""
-=== EQUATIONS ===
-The following equations are critical to understanding the document content.
-Do NOT simplify or modify these equations - they must be preserved exactly.
-
-{equations_context}
-=== END EQUATIONS ===
-"""
-    
-    return f"""{SYSTEM_PROMPT}
-
-=== DOCUMENT CONTENT ===
-{context}
-=== END DOCUMENT CONTENT ===
-{equations_section}
-QUESTION: {question}
-
-CRITICAL: You MUST respond with valid JSON including citations array.
-
-Example Response Format:
-{{
-    "answer": "Your answer summarizing the content from the paragraphs above",
-    "citations": ["s1_p7"],
-    "confidence": "low"
-}}
-
-Now provide your response as JSON:"""
+    return "".join((
+        _PROMPT_HEADER,
+        context,
+        _PROMPT_CONTEXT_END,
+        build_equations_section(equations_context),
+        "\nQUESTION: ",
+        question,
+        _PROMPT_TAIL,
+    ))
 
 
 def explain_question(
@@ -200,3 +283,258 @@ def explain_question(
     
     # Return the final response
     return result["final_response"]
+
+
+def build_batch_prompt(
+    context: str,
+    questions: list[tuple[list[str], str]],
+    equations_context: str = "",
+) -> str:
+    """Build a single prompt that asks several questions at once.
+    
+    The system prompt and shared document content appear once; each
+    question lists the paragraph IDs it may be answered from.
+    
+    Args:
+        context: The formatted paragraph context (union for all questions)
+        questions: List of (paragraph_ids, question) pairs
+        equations_context: Optional formatted equations block
+        
+    Returns:
+        Complete prompt string
+    """
+    equations_section = build_equations_section(equations_context)
+    
+    question_lines = []
+    for number, (paragraph_ids, question) in enumerate(questions, start=1):
+        question_lines.append(
+            f"Q{number} (use only paragraphs {', '.join(paragraph_ids)}): {question}"
+        )
+    questions_block = "\n".join(question_lines)
+    
+    return _PROMPT_HEADER + context + _PROMPT_CONTEXT_END + f"""{equations_section}
+=== QUESTIONS ===
+{questions_block}
+=== END QUESTIONS ===
+
+CRITICAL: Answer EVERY question independently, using ONLY the paragraphs listed for it.
+Respond with a JSON array containing one object per question, where "id" is the question number.
+
+Example Response Format:
+[
+    {{
+        "id": 1,
+        "answer": "Your answer summarizing the content from the paragraphs above",
+        "citations": ["s1_p7"],
+        "confidence": "low"
+    }}
+]
+
+Now provide your response as a JSON array:"""
+
+
+def explain_questions_batch(
+    document: Document,
+    questions: list[tuple[list[str], str]],
+    llm: LLMInterface,
+    max_batch_size: int = MAX_BATCH_SIZE,
+) -> list[dict]:
+    """Answer several questions about a document with batched LLM calls.
+    
+    Up to max_batch_size questions share one prompt, so the system prompt
+    and overlapping paragraphs are sent once per batch instead of once per
+    question. Each answer goes through the same citation filtering and
+    verification as explain_question. The evidence linker and composer
+    steps are skipped: explain_question runs them, but its response is
+    the verified answer and does not include their output, so a batched
+    result equals the explain_question result for the same paragraphs
+    and answer, without the extra composer call per question. Questions
+    that cannot be batched (no valid paragraphs, or missing from an
+    unparseable response) fall back to an individual explain_question
+    call.
+    
+    Args:
+        document: The Document to query
+        questions: List of (paragraph_ids, question) pairs
+        llm: The LLM interface to use for generation
+        max_batch_size: Maximum number of questions per LLM call
+        
+    Returns:
+        List of response dicts (answer, citations, confidence), in the
+        same order as questions; the same shape explain_question returns
+        without include_debug
+        
+    Raises:
+        ValueError: If max_batch_size is less than 1
+    """
+    # Import here to avoid circular imports
+    from evidex.graph import retrieve_paragraphs_node, verifier_node
+    
+    if max_batch_size < 1:
+        raise ValueError("max_batch_size must be at least 1")
+    
+    results: list[dict | None] = [None] * len(questions)
+    
+    # Retrieve context per question; questions without any valid paragraph
+    # need the planner, so they go through the full graph instead
+    batchable = []
+    for index, (paragraph_ids, question) in enumerate(questions):
+        retrieved = retrieve_paragraphs_node({
+            "document": document,
+            "paragraph_ids": paragraph_ids,
+        })
+        if retrieved["paragraphs"]:
+            batchable.append((index, question, retrieved))
+    
+    for batch_start in range(0, len(batchable), max_batch_size):
+        batch = batchable[batch_start:batch_start + max_batch_size]
+        
+        # Union of paragraphs and equations across the batch, in order
+        paragraphs: list[Paragraph] = []
+        equations: list[Equation] = []
+        seen_paragraph_ids: set[str] = set()
+        seen_equation_ids: set[str] = set()
+        for _, _, retrieved in batch:
+            for para in retrieved["paragraphs"]:
+                if para.paragraph_id not in seen_paragraph_ids:
+                    seen_paragraph_ids.add(para.paragraph_id)
+                    paragraphs.append(para)
+            for eq in retrieved["equations"]:
+                if eq.equation_id not in seen_equation_ids:
+                    seen_equation_ids.add(eq.equation_id)
+                    equations.append(eq)
+        
+        prompt = build_batch_prompt(
+            build_context_block(paragraphs),
+            [
+                ([p.paragraph_id for p in retrieved["paragraphs"]], question)
+                for _, question, retrieved in batch
+            ],
+            build_equations_block(equations),
+        )
+        
+        try:
+            answers = parse_llm_response_batch(llm.generate(prompt))
+        except ValueError:
+            # Unparseable batch: every question falls back below
+            continue
+        
+        answers_by_number = {}
+        for answer in answers:
+            if isinstance(answer.get("id"), int):
+                answers_by_number.setdefault(answer["id"], answer)
+        
+        for number, (index, _, retrieved) in enumerate(batch, start=1):
+            answer = answers_by_number.get(number)
+            if answer is None:
+                continue
+            
+            # Same citation filtering as explain_node, then verification.
+            # The model may send null, a bare ID or non-string entries.
+            raw_citations = answer.get("citations") or []
+            if isinstance(raw_citations, str):
+                raw_citations = [raw_citations]
+            elif not isinstance(raw_citations, list):
+                raw_citations = []
+            valid_ids = {p.paragraph_id for p in retrieved["paragraphs"]}
+            final_response = {
+                "answer": answer.get("answer", "Not defined in the paper"),
+                "citations": [
+                    cid for cid in raw_citations
+                    if isinstance(cid, str) and cid in valid_ids
+                ],
+            }
+            verified = verifier_node({
+                "final_response": final_response,
+                "paragraphs": retrieved["paragraphs"],
+            })
+            results[index] = verified["final_response"]
+    
+    for index, (paragraph_ids, question) in enumerate(questions):
+        if results[index] is None:
+            results[index] = explain_question(document, paragraph_ids, question, llm)
+    
+    return results
+
+
+async def aexplain_question(
+    document: Document,
+    paragraph_ids: list[str],
+    question: str,
+    llm: LLMInterface,
+    include_debug: bool = False,
+) -> dict:
+    """Asynchronous variant of explain_question.
+    
+    The workflow is synchronous and spends most of its time waiting on the
+    LLM, so it runs in a worker thread, leaving the event loop free to
+    serve other requests meanwhile.
+    
+    Args:
+        document: The Document to query
+        paragraph_ids: List of paragraph IDs to use as context
+        question: The question to answer
+        llm: The LLM interface to use for generation
+        include_debug: If True, include debug info in response (default: False)
+        
+    Returns:
+        Same response dict as explain_question
+    """
+    return await asyncio.to_thread(
+        explain_question, document, paragraph_ids, question, llm, include_debug
+    )
+
+
+async def explain_questions_concurrent(
+    requests: list[tuple[Document, list[str], str]],
+    llm: LLMInterface,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_minute: int | None = None,
+) -> list[dict]:
+    """Answer many independent questions concurrently.
+    
+    At most max_concurrency questions are in flight at once. If
+    requests_per_minute is given, question starts are also spaced evenly.
+    The limit is per question, not per LLM call: a question can make up
+    to two calls (explain and composer), so set it to at most half of a
+    provider's request limit.
+    
+    Args:
+        requests: List of (document, paragraph_ids, question) tuples
+        llm: The LLM interface to use for generation (must be thread-safe)
+        max_concurrency: Maximum number of questions answered at once
+        requests_per_minute: Optional cap on question starts per minute
+            (not LLM calls; each question may make two)
+        
+    Returns:
+        List of response dicts, in the same order as requests
+        
+    Raises:
+        ValueError: If max_concurrency or requests_per_minute is not positive
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if requests_per_minute is not None and requests_per_minute < 1:
+        raise ValueError("requests_per_minute must be at least 1")
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    start_lock = asyncio.Lock()
+    interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+    next_start = 0.0
+    
+    async def run(document: Document, paragraph_ids: list[str], question: str) -> dict:
+        nonlocal next_start
+        async with semaphore:
+            if interval:
+                # Reserve the next start slot, then wait for it outside the lock
+                async with start_lock:
+                    now = asyncio.get_running_loop().time()
+                    delay = next_start - now
+                    next_start = max(now, next_start) + interval
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            return await aexplain_question(document, paragraph_ids, question, llm)
+    
+    return list(await asyncio.gather(
+        *(run(document, paragraph_ids, question) for document, paragraph_ids, question in requests)
+    ))
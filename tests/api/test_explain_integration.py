@@ -5,22 +5,8 @@ These tests use the real Attention document and exercise the full
 LangGraph workflow without mocking. They verify true system behavior.
 """
 
-import pytest
 from fastapi.testclient import TestClient
 
-from evidex.api.app import create_app
-
-
-@pytest.fixture(scope="module")
-def client() -> TestClient:
-    """Create a test client for the API.
-    
-    Uses module scope to share the client (and cached document)
-    across all tests in this module.
-    """
-    app = create_app()
-    return TestClient(app)
-
 
 # =============================================================================
 # Health Endpoint Tests
@@ -23,42 +23,34 @@ from evidex.api.routes import (
 class TestValidateQuestion:
     """Tests for validate_question function."""
     
-    def test_valid_question_returns_normalized(self) -> None:
-        """Valid question is returned with whitespace stripped."""
-        result = validate_question("  What is attention?  ")
-        assert result == "What is attention?"
-    
-    def test_empty_question_raises_400(self) -> None:
-        """Empty question raises HTTPException with 400."""
-        with pytest.raises(HTTPException) as exc_info:
-            validate_question("")
-        
-        assert exc_info.value.status_code == 400
-        assert "empty" in exc_info.value.detail.lower()
-    
-    def test_whitespace_only_raises_400(self) -> None:
-        """Whitespace-only question raises HTTPException with 400."""
-        with pytest.raises(HTTPException) as exc_info:
-            validate_question("   \n\t  ")
-        
-        assert exc_info.value.status_code == 400
-        assert "empty" in exc_info.value.detail.lower()
-    
-    def test_question_at_max_length_accepted(self) -> None:
-        """Question at exactly max length is accepted."""
-        question = "x" * MAX_QUESTION_LENGTH
-        result = validate_question(question)
-        assert result == question
-    
-    def test_question_over_max_length_raises_400(self) -> None:
-        """Question over max length raises HTTPException with 400."""
-        question = "x" * (MAX_QUESTION_LENGTH + 1)
-        
+    @pytest.mark.parametrize(
+        ("question", "expected"),
+        [
+            ("  What is attention?  ", "What is attention?"),
+            ("x" * MAX_QUESTION_LENGTH, "x" * MAX_QUESTION_LENGTH),
+        ],
+        ids=["whitespace_stripped", "at_max_length"],
+    )
+    def test_accepts_valid_question(self, question: str, expected: str) -> None:
+        """Valid questions (up to max length) are returned with whitespace stripped."""
+        assert validate_question(question) == expected
+    
+    @pytest.mark.parametrize(
+        ("question", "detail_substring"),
+        [
+            ("", "empty"),
+            ("   \n\t  ", "empty"),
+            ("x" * (MAX_QUESTION_LENGTH + 1), "length"),
+        ],
+        ids=["empty", "whitespace_only", "over_max_length"],
+    )
+    def test_rejects_invalid_question(self, question: str, detail_substring: str) -> None:
+        """Empty, whitespace-only, and over-length questions raise HTTPException with 400."""
         with pytest.raises(HTTPException) as exc_info:
             validate_question(question)
         
         assert exc_info.value.status_code == 400
-        assert "length" in exc_info.value.detail.lower()
+        assert detail_substring in exc_info.value.detail.lower()
 
 
 # =============================================================================
@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the Evidex test suite.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from evidex.api.app import create_app
+from evidex.graph import create_qa_graph
+from evidex.llm import MockLLM
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    """Create a test client for the API.
+    
+    Uses session scope so every API test module shares one app (and the
+    document cached by load_document) instead of building its own.
+    """
+    app = create_app()
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def compiled_graph():
+    """Compile the QA graph once for the whole test session.
+    
+    The compiled graph holds no per-run state (there is no checkpointer),
+    so tests can share it.
+    """
+    return create_qa_graph()
+
+
+@pytest.fixture
+def unused_llm() -> Iterator[MockLLM]:
+    """Fill the llm slot of graph states whose code path never calls the LLM.
+    
+    A fresh mock per test; teardown fails the test if it was called.
+    """
+    llm = MockLLM()
+    yield llm
+    assert llm.call_history == [], "unused_llm was called"
@@ -15,13 +15,14 @@ Tests cover:
 
 import pytest
 import json
-from pathlib import Path
 
 from evidex.models import Paragraph, Section, Document, Equation, Entities
 from evidex.llm import MockLLM, LLMResponse
 from evidex.graph import (
+    COMPOSER_SYSTEM_PROMPT,
     QAState,
     composer_node,
+    build_composer_messages,
     build_composer_prompt,
     parse_composer_response,
     verify_composed_explanation,
@@ -29,11 +30,61 @@ from evidex.graph import (
 )
 
 
+# =============================================================================
+# Mock LLM Payloads
+# =============================================================================
+# Serialized once at import; the mock_llm_* fixtures below wrap these.
+
+_VALID_COMPOSITION_JSON = json.dumps({
+    "composed_explanation": "Attention maps queries to outputs using key-value pairs. [s1_p1] The computation uses scaled dot-product with dimension d_k. [s1_p2] A softmax function determines the weights. [s1_p3]",
+    "sentences": [
+        {"text": "Attention maps queries to outputs using key-value pairs.", "citation": "s1_p1"},
+        {"text": "The computation uses scaled dot-product with dimension d_k.", "citation": "s1_p2"},
+        {"text": "A softmax function determines the weights.", "citation": "s1_p3"},
+    ]
+})
+
+_MISSING_CITATION_JSON = json.dumps({
+    "composed_explanation": "Attention is a mechanism. The computation uses softmax. [s1_p3]",
+    "sentences": [
+        {"text": "Attention is a mechanism.", "citation": ""},  # Missing citation!
+        {"text": "The computation uses softmax.", "citation": "s1_p3"},
+    ]
+})
+
+_INVALID_CITATION_JSON = json.dumps({
+    "composed_explanation": "Attention uses queries. [s1_p1] This is from an invalid source. [s99_p99]",
+    "sentences": [
+        {"text": "Attention uses queries.", "citation": "s1_p1"},
+        {"text": "This is from an invalid source.", "citation": "s99_p99"},  # Invalid!
+    ]
+})
+
+_NEW_ENTITY_JSON = json.dumps({
+    "composed_explanation": "Attention uses queries. [s1_p1] The LSTM layer processes sequences. [s1_p2]",
+    "sentences": [
+        {"text": "Attention uses queries.", "citation": "s1_p1"},
+        {"text": "The LSTM layer processes sequences.", "citation": "s1_p2"},  # LSTM not in sources!
+    ]
+})
+
+_MERGED_IDEAS_JSON = json.dumps({
+    "composed_explanation": "Attention achieves high BLEU scores through softmax. [s1_p1]",
+    "sentences": [
+        {"text": "Attention achieves high BLEU scores through softmax.", "citation": "s1_p1"},
+        # This merges attention mechanics with BLEU results - not supported
+    ]
+})
+
+
+
 # =============================================================================
 # Test Fixtures
 # =============================================================================
+# These fixtures are read-only in every test, so they are built once per
+# module. Tests that need a different document or response build their own.
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def attention_document() -> Document:
     """Create a document about attention with multiple paragraphs and equations."""
     return Document(
@@ -92,70 +143,39 @@ def attention_document() -> Document:
     )
 
 
-@pytest.fixture
+def _valid_ids(paragraphs: list[Paragraph]) -> set[str]:
+    """Collect the paragraph IDs a composition may cite."""
+    return {p.paragraph_id for p in paragraphs}
+
+
+@pytest.fixture(scope="module")
 def mock_llm_valid_composition() -> MockLLM:
     """Mock LLM that returns a valid composed explanation."""
-    response = json.dumps({
-        "composed_explanation": "Attention maps queries to outputs using key-value pairs. [s1_p1] The computation uses scaled dot-product with dimension d_k. [s1_p2] A softmax function determines the weights. [s1_p3]",
-        "sentences": [
-            {"text": "Attention maps queries to outputs using key-value pairs.", "citation": "s1_p1"},
-            {"text": "The computation uses scaled dot-product with dimension d_k.", "citation": "s1_p2"},
-            {"text": "A softmax function determines the weights.", "citation": "s1_p3"},
-        ]
-    })
-    return MockLLM(default_response=response)
+    return MockLLM(default_response=_VALID_COMPOSITION_JSON)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm_missing_citation() -> MockLLM:
     """Mock LLM that returns a composition with missing citation."""
-    response = json.dumps({
-        "composed_explanation": "Attention is a mechanism. The computation uses softmax. [s1_p3]",
-        "sentences": [
-            {"text": "Attention is a mechanism.", "citation": ""},  # Missing citation!
-            {"text": "The computation uses softmax.", "citation": "s1_p3"},
-        ]
-    })
-    return MockLLM(default_response=response)
+    return MockLLM(default_response=_MISSING_CITATION_JSON)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm_invalid_citation() -> MockLLM:
     """Mock LLM that returns a composition with invalid citation."""
-    response = json.dumps({
-        "composed_explanation": "Attention uses queries. [s1_p1] This is from an invalid source. [s99_p99]",
-        "sentences": [
-            {"text": "Attention uses queries.", "citation": "s1_p1"},
-            {"text": "This is from an invalid source.", "citation": "s99_p99"},  # Invalid!
-        ]
-    })
-    return MockLLM(default_response=response)
+    return MockLLM(default_response=_INVALID_CITATION_JSON)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm_new_entity() -> MockLLM:
     """Mock LLM that introduces a new technical entity not in sources."""
-    response = json.dumps({
-        "composed_explanation": "Attention uses queries. [s1_p1] The LSTM layer processes sequences. [s1_p2]",
-        "sentences": [
-            {"text": "Attention uses queries.", "citation": "s1_p1"},
-            {"text": "The LSTM layer processes sequences.", "citation": "s1_p2"},  # LSTM not in sources!
-        ]
-    })
-    return MockLLM(default_response=response)
+    return MockLLM(default_response=_NEW_ENTITY_JSON)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm_merged_ideas() -> MockLLM:
     """Mock LLM that incorrectly merges attention and BLEU concepts."""
-    response = json.dumps({
-        "composed_explanation": "Attention achieves high BLEU scores through softmax. [s1_p1]",
-        "sentences": [
-            {"text": "Attention achieves high BLEU scores through softmax.", "citation": "s1_p1"},
-            # This merges attention mechanics with BLEU results - not supported
-        ]
-    })
-    return MockLLM(default_response=response)
+    return MockLLM(default_response=_MERGED_IDEAS_JSON)
 
 
 # =============================================================================
@@ -183,14 +203,14 @@ class TestComposerBasic:
         assert "composed_explanation" in result
         assert "composer_verification_passed" in result
     
-    def test_empty_paragraphs_returns_none(self):
+    def test_empty_paragraphs_returns_none(self, unused_llm: MockLLM):
         """Test that empty input returns None composed explanation."""
         state: QAState = {
             "paragraphs": [],
             "equations": [],
             "linked_evidence": [],
             "question": "Test question",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = composer_node(state)
@@ -484,7 +504,6 @@ class TestVerifyComposedExplanation:
             {"text": "Attention uses queries.", "citation": "s1_p1"},
             {"text": "Softmax computes weights.", "citation": "s1_p2"},
         ]
-        valid_ids = {"s1_p1", "s1_p2"}
         paragraphs = [
             Paragraph(
                 paragraph_id="s1_p1",
@@ -497,6 +516,7 @@ class TestVerifyComposedExplanation:
                 entities=Entities(variables=[], concepts=["softmax"]),
             ),
         ]
+        valid_ids = _valid_ids(paragraphs)
         
         passed, reason = verify_composed_explanation(sentences, valid_ids, paragraphs, [])
         
@@ -510,24 +530,24 @@ class TestVerifyComposedExplanation:
         assert passed is False
         assert "No sentences" in reason
     
-    def test_fails_missing_citation(self):
+    def test_fails_missing_citation(self, attention_document: Document):
         """Test that missing citation fails verification."""
         sentences = [
             {"text": "Some statement.", "citation": ""},  # Empty citation
         ]
-        valid_ids = {"s1_p1"}
+        valid_ids = _valid_ids(attention_document.sections[0].paragraphs)
         
         passed, reason = verify_composed_explanation(sentences, valid_ids, [], [])
         
         assert passed is False
         assert "lacks a citation" in reason
     
-    def test_fails_invalid_citation(self):
+    def test_fails_invalid_citation(self, attention_document: Document):
         """Test that invalid citation fails verification."""
         sentences = [
             {"text": "Some statement.", "citation": "invalid_id"},
         ]
-        valid_ids = {"s1_p1", "s1_p2"}
+        valid_ids = _valid_ids(attention_document.sections[0].paragraphs)
         
         passed, reason = verify_composed_explanation(sentences, valid_ids, [], [])
         
@@ -549,7 +569,9 @@ class TestComposerInGraph:
         # The graph should be able to invoke
         assert graph is not None
     
-    def test_full_graph_returns_composed_explanation(self, attention_document: Document):
+    def test_full_graph_returns_composed_explanation(
+        self, attention_document: Document, compiled_graph
+    ):
         """Test that the full graph workflow returns composed_explanation."""
         # Create mock LLM that handles both explain and composer prompts
         explain_response = json.dumps({
@@ -562,28 +584,23 @@ class TestComposerInGraph:
             "sentences": [{"text": "Attention maps queries to outputs.", "citation": "s1_p1"}]
         })
         
-        call_count = [0]
+        # Keyed on whether the prompt opens with the composer system prompt,
+        # so dispatch only inspects the prefix instead of scanning the prompt
+        responses = {False: explain_response, True: compose_response}
         
         def response_generator(prompt: str) -> LLMResponse:
-            call_count[0] += 1
-            # First call is explain, second is composer
-            if "CRITICAL RULES" in prompt and "composed_explanation" not in prompt:
-                return LLMResponse(content=explain_response)
-            else:
-                return LLMResponse(content=compose_response)
+            return LLMResponse(content=responses[prompt.startswith(COMPOSER_SYSTEM_PROMPT)])
         
         mock_llm = MockLLM()
         mock_llm.generate = response_generator
         
-        graph = create_qa_graph()
-        
         initial_state: QAState = {
             "document": attention_document,
             "question": "How does attention work?",
             "llm": mock_llm,
         }
         
-        result = graph.invoke(initial_state)
+        result = compiled_graph.invoke(initial_state)
         
         # Should have composed_explanation in the result
         assert "composed_explanation" in result
@@ -628,3 +645,18 @@ class TestBuildComposerPrompt:
         assert "ONLY paraphrase" in prompt
         assert "cite" in prompt.lower()
         assert "NOT introduce new" in prompt
+    
+    def test_messages_join_to_prompt(self, attention_document: Document):
+        """Test that composer messages lead with the rules and join to the prompt."""
+        paragraphs = attention_document.sections[0].paragraphs
+        equations = attention_document.equations
+        linked_evidence = [
+            {"source_ids": ["s1_p1", "eq1"], "shared_entities": {"variables": ["Q"], "concepts": []}}
+        ]
+        
+        messages = build_composer_messages(paragraphs, equations, linked_evidence, "Test")
+        
+        assert messages[0] == {"role": "system", "content": COMPOSER_SYSTEM_PROMPT}
+        assert "".join(m["content"] for m in messages) == build_composer_prompt(
+            paragraphs, equations, linked_evidence, "Test"
+        )
@@ -18,7 +18,6 @@ from evidex.graph import (
     QAState,
     planner_node,
     verifier_node,
-    create_qa_graph,
     explain_question_graph,
 )
 
@@ -27,7 +26,7 @@ from evidex.graph import (
 # Test Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_document() -> Document:
     """Create a sample document for testing."""
     return Document(
@@ -229,7 +228,7 @@ class TestSystemDerivedConfidence:
 class TestConfidenceInFullWorkflow:
     """Integration tests for confidence in the full workflow."""
     
-    def test_auto_planner_with_citations_gives_high(self, sample_document: Document):
+    def test_auto_planner_with_citations_gives_high(self, sample_document: Document, compiled_graph):
         """Test that auto-planner + citations = high confidence in full workflow."""
         mock_llm = MockLLM(
             keyword_responses={
@@ -241,8 +240,6 @@ class TestConfidenceInFullWorkflow:
             }
         )
         
-        graph = create_qa_graph()
-        
         # Don't provide paragraph_ids - let planner select automatically
         initial_state: QAState = {
             "document": sample_document,
@@ -250,7 +247,7 @@ class TestConfidenceInFullWorkflow:
             "llm": mock_llm,
         }
         
-        result = graph.invoke(initial_state)
+        result = compiled_graph.invoke(initial_state)
         
         # Planner auto-selected + citations + verified = high
         assert result["planner_selected_automatically"] is True
@@ -258,7 +255,7 @@ class TestConfidenceInFullWorkflow:
         assert len(result["final_response"]["citations"]) > 0
         assert result["final_response"]["confidence"] == "high"
     
-    def test_manual_paragraphs_with_citations_gives_low(self, sample_document: Document):
+    def test_manual_paragraphs_with_citations_gives_low(self, sample_document: Document, compiled_graph):
         """Test that manual paragraphs + citations = low confidence."""
         mock_llm = MockLLM(
             default_response=MockLLM.create_response(
@@ -268,8 +265,6 @@ class TestConfidenceInFullWorkflow:
             )
         )
         
-        graph = create_qa_graph()
-        
         # Provide paragraph_ids - manual selection
         initial_state: QAState = {
             "document": sample_document,
@@ -278,7 +273,7 @@ class TestConfidenceInFullWorkflow:
             "llm": mock_llm,
         }
         
-        result = graph.invoke(initial_state)
+        result = compiled_graph.invoke(initial_state)
         
         # Manual selection = low confidence even with citations
         assert result["planner_selected_automatically"] is False
@@ -13,7 +13,6 @@ from evidex.graph import (
     QAState,
     planner_node,
     verifier_node,
-    create_qa_graph,
     explain_question_graph,
 )
 
@@ -22,7 +21,7 @@ from evidex.graph import (
 # Test Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_document() -> Document:
     """Create a sample document for testing."""
     return Document(
@@ -61,12 +60,12 @@ def sample_document() -> Document:
 class TestPlannerReason:
     """Tests for planner_reason output."""
     
-    def test_planner_sets_reason_for_keyword_match(self, sample_document: Document):
+    def test_planner_sets_reason_for_keyword_match(self, sample_document: Document, unused_llm: MockLLM):
         """Test that planner provides reason when matching keywords."""
         state: QAState = {
             "document": sample_document,
             "question": "What is attention?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -75,12 +74,12 @@ class TestPlannerReason:
         assert "Selected" in result["planner_reason"]
         assert "keyword" in result["planner_reason"].lower()
     
-    def test_planner_sets_reason_for_no_match(self, sample_document: Document):
+    def test_planner_sets_reason_for_no_match(self, sample_document: Document, unused_llm: MockLLM):
         """Test that planner explains when no paragraphs match."""
         state: QAState = {
             "document": sample_document,
             "question": "What about quantum computing?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -89,13 +88,13 @@ class TestPlannerReason:
         assert result["candidate_paragraph_ids"] == []
         assert "No paragraphs matched" in result["planner_reason"] or "not" in result["planner_reason"].lower()
     
-    def test_planner_sets_reason_for_provided_ids(self, sample_document: Document):
+    def test_planner_sets_reason_for_provided_ids(self, sample_document: Document, unused_llm: MockLLM):
         """Test that planner explains when using provided IDs."""
         state: QAState = {
             "document": sample_document,
             "paragraph_ids": ["s1_p1", "s1_p2"],
             "question": "What is attention?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -104,12 +103,12 @@ class TestPlannerReason:
         assert "provided" in result["planner_reason"].lower()
         assert "2" in result["planner_reason"]  # 2 provided IDs
     
-    def test_planner_reason_includes_top_matches(self, sample_document: Document):
+    def test_planner_reason_includes_top_matches(self, sample_document: Document, unused_llm: MockLLM):
         """Test that planner reason shows top matching paragraphs."""
         state: QAState = {
             "document": sample_document,
             "question": "How does attention work in transformers?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -126,13 +125,13 @@ class TestPlannerReason:
 class TestVerifierReason:
     """Tests for verifier_reason output."""
     
-    def test_verifier_sets_reason_for_valid_response(self, sample_document: Document):
+    def test_verifier_sets_reason_for_valid_response(self, sample_document: Document, unused_llm: MockLLM):
         """Test that verifier explains successful validation."""
         paragraphs = sample_document.get_paragraphs(["s1_p1"])
         state: QAState = {
             "document": sample_document,
             "question": "What is attention?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
             "paragraphs": paragraphs,
             "final_response": {
                 "answer": "Attention mechanisms are fundamental.",
@@ -147,13 +146,13 @@ class TestVerifierReason:
         assert "PASSED" in result["verifier_reason"]
         assert result["verification_passed"] is True
     
-    def test_verifier_sets_reason_for_missing_citations(self, sample_document: Document):
+    def test_verifier_sets_reason_for_missing_citations(self, sample_document: Document, unused_llm: MockLLM):
         """Test that verifier explains rejection due to missing citations."""
         paragraphs = sample_document.get_paragraphs(["s1_p1"])
         state: QAState = {
             "document": sample_document,
             "question": "What is attention?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
             "paragraphs": paragraphs,
             "final_response": {
                 "answer": "Some answer without citations.",
@@ -169,13 +168,13 @@ class TestVerifierReason:
         assert "citation" in result["verifier_reason"].lower()
         assert result["verification_passed"] is False
     
-    def test_verifier_sets_reason_for_invalid_citations(self, sample_document: Document):
+    def test_verifier_sets_reason_for_invalid_citations(self, sample_document: Document, unused_llm: MockLLM):
         """Test that verifier explains rejection due to invalid citations."""
         paragraphs = sample_document.get_paragraphs(["s1_p1"])
         state: QAState = {
             "document": sample_document,
             "question": "What is attention?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
             "paragraphs": paragraphs,
             "final_response": {
                 "answer": "Some answer.",
@@ -191,13 +190,13 @@ class TestVerifierReason:
         assert "s99_p99" in result["verifier_reason"]
         assert result["verification_passed"] is False
     
-    def test_verifier_sets_reason_for_not_defined(self, sample_document: Document):
+    def test_verifier_sets_reason_for_not_defined(self, sample_document: Document, unused_llm: MockLLM):
         """Test that verifier explains 'not defined' response."""
         paragraphs = sample_document.get_paragraphs(["s1_p1"])
         state: QAState = {
             "document": sample_document,
             "question": "What about quantum computing?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
             "paragraphs": paragraphs,
             "final_response": {
                 "answer": "Not defined in the paper",
@@ -335,7 +334,7 @@ class TestDebugOutput:
 class TestDebugIntegration:
     """Integration tests for debug output through full workflow."""
     
-    def test_full_workflow_with_debug(self, sample_document: Document):
+    def test_full_workflow_with_debug(self, sample_document: Document, compiled_graph):
         """Test full workflow with debug enabled."""
         llm = MockLLM(
             keyword_responses={
@@ -343,8 +342,6 @@ class TestDebugIntegration:
             }
         )
         
-        graph = create_qa_graph()
-        
         initial_state: QAState = {
             "document": sample_document,
             "question": "How does attention work?",
@@ -352,7 +349,7 @@ class TestDebugIntegration:
             "include_debug": True,
         }
         
-        result = graph.invoke(initial_state)
+        result = compiled_graph.invoke(initial_state)
         
         # Check state has both reasons
         assert "planner_reason" in result
@@ -6,35 +6,66 @@ and explain functionality. Tests use the real Attention paper and
 exercise the full LangGraph workflow without mocking.
 """
 
+import io
 import os
-import time
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
-from evidex.api.app import create_app
-from evidex.api.registry import DOCUMENT_REGISTRY, DocumentStatus
+from evidex.api.registry import DOCUMENT_REGISTRY, DocumentEntry, DocumentStatus
 
 
 # Path to the test PDF
 ATTENTION_PDF_PATH = Path(__file__).parent.parent / "NIPS-2017-attention-is-all-you-need-Paper.pdf"
 
+# Read once; each upload wraps the bytes in a fresh BytesIO
+_PDF_BYTES = ATTENTION_PDF_PATH.read_bytes()
+
 # Check if Groq API key is available for LLM tests
 GROQ_API_KEY_AVAILABLE = bool(os.environ.get("GROQ_API_KEY"))
 
 
+# Entries of documents ingested once per module, restored after each clear
+_PRESERVED_ENTRIES: dict[str, DocumentEntry] = {}
+
+
 @pytest.fixture(scope="module")
-def client() -> TestClient:
-    """Create a test client for the API."""
-    app = create_app()
-    return TestClient(app)
+def ingested_document(client: TestClient) -> str:
+    """Upload the Attention paper once per module and wait for ingestion.
+    
+    Tests only read the ingested document, so parsing the PDF once is
+    enough. Tests that upload or reparse use their own documents.
+    """
+    upload_response = client.post(
+        "/documents/upload",
+        files={"file": ("attention.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")},
+    )
+    
+    document_id = upload_response.json()["document_id"]
+    
+    # Wait for ingestion
+    entry = DOCUMENT_REGISTRY.get(document_id)
+    if not entry.ready_event.wait(timeout=30):
+        pytest.fail("Document ingestion timed out")
+    assert entry.status == DocumentStatus.READY
+    
+    _PRESERVED_ENTRIES[document_id] = entry
+    yield document_id
+    del _PRESERVED_ENTRIES[document_id]
+    DOCUMENT_REGISTRY.remove(document_id)
 
 
 @pytest.fixture(autouse=True)
-def clear_registry():
-    """Clear the document registry before each test."""
+def clear_registry(request: pytest.FixtureRequest):
+    """Clear the document registry before each test.
+    
+    The module's ingested document is put back for the tests that use it.
+    """
     DOCUMENT_REGISTRY.clear()
+    if "ingested_document" in request.fixturenames:
+        for entry in _PRESERVED_ENTRIES.values():
+            DOCUMENT_REGISTRY.add(entry)
     yield
     DOCUMENT_REGISTRY.clear()
 
@@ -48,11 +79,10 @@ class TestUploadDocument:
     
     def test_upload_pdf_returns_202(self, client: TestClient) -> None:
         """Uploading a PDF returns 202 Accepted."""
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
+        response = client.post(
+            "/documents/upload",
+            files={"file": ("attention.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")},
+        )
         
         assert response.status_code == 202
         data = response.json()
@@ -71,11 +101,10 @@ class TestUploadDocument:
     
     def test_upload_returns_title_from_filename(self, client: TestClient) -> None:
         """Upload response includes title derived from filename."""
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            response = client.post(
-                "/documents/upload",
-                files={"file": ("My Research Paper.pdf", f, "application/pdf")},
-            )
+        response = client.post(
+            "/documents/upload",
+            files={"file": ("My Research Paper.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")},
+        )
         
         assert response.status_code == 202
         data = response.json()
@@ -99,11 +128,10 @@ class TestListDocuments:
     def test_lists_uploaded_documents(self, client: TestClient) -> None:
         """Returns list of uploaded documents."""
         # Upload a document
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            upload_response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
+        upload_response = client.post(
+            "/documents/upload",
+            files={"file": ("attention.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")},
+        )
         
         document_id = upload_response.json()["document_id"]
         
@@ -124,32 +152,13 @@ class TestListDocuments:
 class TestGetSections:
     """Tests for GET /documents/{document_id}/sections."""
     
-    def test_get_sections_after_ingestion(self, client: TestClient) -> None:
+    def test_get_sections_after_ingestion(self, client: TestClient, ingested_document: str) -> None:
         """Returns sections after document is ingested."""
-        # Upload and wait for ingestion
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            upload_response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
-        
-        document_id = upload_response.json()["document_id"]
-        
-        # Wait for ingestion to complete (with timeout)
-        for _ in range(30):  # 30 second timeout
-            entry = DOCUMENT_REGISTRY.get(document_id)
-            if entry and entry.status == DocumentStatus.READY:
-                break
-            time.sleep(1)
-        else:
-            pytest.fail("Document ingestion timed out")
-        
-        # Get sections
-        response = client.get(f"/documents/{document_id}/sections")
+        response = client.get(f"/documents/{ingested_document}/sections")
         
         assert response.status_code == 200
         data = response.json()
-        assert data["document_id"] == document_id
+        assert data["document_id"] == ingested_document
         assert len(data["sections"]) > 0
         
         # Each section should have title and paragraph_ids
@@ -167,11 +176,10 @@ class TestGetSections:
     def test_get_sections_while_ingesting(self, client: TestClient) -> None:
         """Returns 409 Conflict while document is still ingesting."""
         # Upload a document
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            upload_response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
+        upload_response = client.post(
+            "/documents/upload",
+            files={"file": ("attention.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")},
+        )
         
         document_id = upload_response.json()["document_id"]
         
@@ -191,26 +199,6 @@ class TestGetSections:
 class TestGetParagraph:
     """Tests for GET /documents/{document_id}/paragraphs/{paragraph_id}."""
     
-    @pytest.fixture
-    def ingested_document(self, client: TestClient) -> str:
-        """Upload and wait for a document to be ingested."""
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            upload_response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
-        
-        document_id = upload_response.json()["document_id"]
-        
-        # Wait for ingestion
-        for _ in range(30):
-            entry = DOCUMENT_REGISTRY.get(document_id)
-            if entry and entry.status == DocumentStatus.READY:
-                return document_id
-            time.sleep(1)
-        
-        pytest.fail("Document ingestion timed out")
-    
     def test_get_paragraph_returns_text(self, client: TestClient, ingested_document: str) -> None:
         """Returns paragraph text and metadata."""
         # First get sections to find a valid paragraph ID
@@ -250,26 +238,6 @@ class TestGetParagraph:
 class TestExplainDocument:
     """Tests for POST /documents/{document_id}/explain."""
     
-    @pytest.fixture
-    def ingested_document(self, client: TestClient) -> str:
-        """Upload and wait for a document to be ingested."""
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            upload_response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
-        
-        document_id = upload_response.json()["document_id"]
-        
-        # Wait for ingestion
-        for _ in range(30):
-            entry = DOCUMENT_REGISTRY.get(document_id)
-            if entry and entry.status == DocumentStatus.READY:
-                return document_id
-            time.sleep(1)
-        
-        pytest.fail("Document ingestion timed out")
-    
     def test_empty_question_rejected(self, client: TestClient, ingested_document: str) -> None:
         """Empty question is rejected with 400."""
         response = client.post(
@@ -331,26 +299,6 @@ class TestExplainDocument:
 class TestDebugGating:
     """Tests for debug output gating."""
     
-    @pytest.fixture
-    def ingested_document(self, client: TestClient) -> str:
-        """Upload and wait for a document to be ingested."""
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            upload_response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
-        
-        document_id = upload_response.json()["document_id"]
-        
-        # Wait for ingestion
-        for _ in range(30):
-            entry = DOCUMENT_REGISTRY.get(document_id)
-            if entry and entry.status == DocumentStatus.READY:
-                return document_id
-            time.sleep(1)
-        
-        pytest.fail("Document ingestion timed out")
-    
     @pytest.mark.skipif(not GROQ_API_KEY_AVAILABLE, reason="GROQ_API_KEY not set")
     def test_debug_present_when_requested(self, client: TestClient, ingested_document: str) -> None:
         """Debug info is included when include_debug=true."""
@@ -425,22 +373,18 @@ class TestReparseDocument:
     def test_reparse_starts_reingestion(self, client: TestClient) -> None:
         """Reparse starts re-ingestion process."""
         # Upload a document and wait for ingestion
-        with open(ATTENTION_PDF_PATH, "rb") as f:
-            upload_response = client.post(
-                "/documents/upload",
-                files={"file": ("attention.pdf", f, "application/pdf")},
-            )
+        upload_response = client.post(
+            "/documents/upload",
+            files={"file": ("attention.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")},
+        )
         
         document_id = upload_response.json()["document_id"]
         
         # Wait for initial ingestion
-        for _ in range(30):
-            entry = DOCUMENT_REGISTRY.get(document_id)
-            if entry and entry.status == DocumentStatus.READY:
-                break
-            time.sleep(1)
-        else:
+        entry = DOCUMENT_REGISTRY.get(document_id)
+        if not entry.ready_event.wait(timeout=30):
             pytest.fail("Initial ingestion timed out")
+        assert entry.status == DocumentStatus.READY
         
         # Request reparse
         response = client.post(f"/documents/{document_id}/reparse")
@@ -449,3 +393,7 @@ class TestReparseDocument:
         data = response.json()
         assert data["document_id"] == document_id
         assert data["status"] == "ingesting"
+        
+        # Re-ingestion signals completion through the same event
+        assert entry.ready_event.wait(timeout=30)
+        assert entry.status == DocumentStatus.READY
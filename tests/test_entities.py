@@ -95,6 +95,14 @@ class TestExtractVariables:
         # Q should appear only once
         assert variables.count("Q") == 1
     
+    def test_deduplicates_case_insensitively(self):
+        """Test that the first spelling of a variable wins across case."""
+        text = "The queries Q and q are scaled by d_k and D_K."
+        
+        variables = extract_variables(text)
+        
+        assert variables == ["Q", "d_k"]
+    
     def test_attention_formula_variables(self):
         """Test extraction from attention formula text."""
         text = "Attention(Q, K, V) = softmax(QK^T / √d_k)V"
@@ -219,6 +227,14 @@ class TestExtractConcepts:
         # Should only appear once despite different cases
         assert concepts.count("transformer") == 1
     
+    def test_prefers_longest_keyword(self):
+        """Test that overlapping keywords resolve to the longest match."""
+        text = "Layer normalization, a layer norm, and a layer followed by the BLEU score."
+        
+        concepts = extract_concepts(text)
+        
+        assert concepts == ["layer normalization", "layer norm", "layer", "bleu score"]
+    
     def test_empty_text_returns_empty(self):
         """Test that empty text returns empty list."""
         concepts = extract_concepts("")
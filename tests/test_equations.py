@@ -7,6 +7,8 @@ Tests that equations are treated as first-class citizens:
 - The prompt clearly marks equations separately from prose
 """
 
+import dataclasses
+
 import pytest
 from pathlib import Path
 
@@ -24,6 +26,7 @@ from evidex.ingest import (
     extract_equations_from_text,
     extract_equations_from_document,
     search_equations,
+    generate_equation_id,
 )
 
 
@@ -125,6 +128,40 @@ class TestEquationModel:
         assert eq.equation_text == "E = mc^2"
         assert eq.associated_paragraph_id == "s1_p1"
     
+    def test_equation_caches_lowercase_text(self):
+        """Test that Equation precomputes its lowercased text for search."""
+        eq = Equation(
+            equation_id="eq1",
+            equation_text="Attention(Q, K, V) = softmax(QK^T)V",
+            associated_paragraph_id="s1_p1",
+        )
+        
+        assert eq.equation_text_lower == "attention(q, k, v) = softmax(qk^t)v"
+        assert "equation_text_lower" not in repr(eq)
+    
+    def test_equation_caches_formatted_block(self):
+        """Test that Equation precomputes its prompt equations block entry."""
+        eq = Equation(
+            equation_id="eq1",
+            equation_text="E = mc^2",
+            associated_paragraph_id="s1_p1",
+        )
+        
+        assert eq.formatted_block == "[eq1] (from s1_p1)\nE = mc^2"
+    
+    def test_equation_is_immutable(self):
+        """Test that Equation cannot be edited, so cached fields stay in sync."""
+        eq = Equation(
+            equation_id="eq1",
+            equation_text="E = mc^2",
+            associated_paragraph_id="s1_p1",
+        )
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            eq.equation_text = "F = ma"
+        assert eq.equation_text_lower == "e = mc^2"
+        assert eq.formatted_block == "[eq1] (from s1_p1)\nE = mc^2"
+    
     def test_paragraph_has_equation_refs(self):
         """Test that Paragraph can have equation_refs."""
         para = Paragraph(
@@ -314,6 +351,87 @@ class TestRetrieveParagraphsNodeWithEquations:
         assert result["equations"] == []
 
 
+# =============================================================================
+# Equation Search Tests
+# =============================================================================
+
+class TestSearchEquations:
+    """Tests for searching equations by text."""
+    
+    def test_case_insensitive_search(self, attention_document_with_equations):
+        """Test that search ignores case by default and preserves order."""
+        result = search_equations(attention_document_with_equations, "attention")
+        
+        assert result == ["eq1", "eq2"]
+    
+    def test_case_sensitive_search(self, attention_document_with_equations):
+        """Test that case-sensitive search respects case."""
+        doc = attention_document_with_equations
+        
+        assert search_equations(doc, "MultiHead", case_sensitive=True) == ["eq3"]
+        assert search_equations(doc, "multihead", case_sensitive=True) == []
+    
+    def test_each_equation_reported_once(self, attention_document_with_equations):
+        """Test that repeated matches within one equation yield a single ID."""
+        result = search_equations(attention_document_with_equations, "v")
+        
+        assert result == ["eq1", "eq2", "eq3"]
+    
+    def test_query_does_not_span_equations(self, attention_document_with_equations):
+        """Test that a match cannot straddle two adjacent equations."""
+        # eq1 ends with ")V" and eq2 starts with "head_i"
+        result = search_equations(attention_document_with_equations, "vhead")
+        
+        assert result == []
+    
+    def test_reflects_added_equations(self, attention_document_with_equations):
+        """Test that equations added after a search are still found."""
+        doc = attention_document_with_equations
+        search_equations(doc, "softmax")
+        doc.equations.append(
+            Equation(
+                equation_id="eq4",
+                equation_text="FFN(x) = max(0, xW_1 + b_1)W_2 + b_2",
+                associated_paragraph_id="s2_p1",
+            )
+        )
+        
+        assert search_equations(doc, "ffn") == ["eq4"]
+    
+    def test_reflects_replaced_equations(self, attention_document_with_equations):
+        """Test that an equation replaced in place is searched by its new text."""
+        doc = attention_document_with_equations
+        assert "eq1" in search_equations(doc, "softmax")
+        doc.equations[0] = Equation(
+            equation_id="eq9",
+            equation_text="z = relu(y)",
+            associated_paragraph_id="s1_p1",
+        )
+        
+        assert "eq1" not in search_equations(doc, "softmax")
+        assert search_equations(doc, "relu") == ["eq9"]
+        assert search_equations(doc, "relu", case_sensitive=True) == ["eq9"]
+    
+    def test_no_equations(self, simple_document_no_equations):
+        """Test searching a document without equations."""
+        assert search_equations(simple_document_no_equations, "x") == []
+
+
+class TestGenerateEquationId:
+    """Tests for equation ID generation."""
+    
+    def test_ids_are_one_indexed(self):
+        """Test that IDs are 1-indexed."""
+        assert generate_equation_id(0) == "eq1"
+        assert generate_equation_id(41) == "eq42"
+    
+    def test_ids_beyond_precomputed_range(self):
+        """Test that large indices still produce sequential IDs."""
+        assert generate_equation_id(999) == "eq1000"
+        assert generate_equation_id(1000) == "eq1001"
+        assert generate_equation_id(123456) == "eq123457"
+
+
 # =============================================================================
 # Equation Extraction Tests
 # =============================================================================
@@ -141,6 +141,54 @@ class TestExplainNode:
         assert result["llm_response"] is not None
         assert result["final_response"]["answer"] == "Test answer"
         assert len(mock_llm.call_history) == 1
+    
+    def test_not_defined_answer_drops_citations(self, sample_document: Document):
+        """Test that citations attached to a 'Not defined' answer are discarded."""
+        mock_llm = MockLLM(
+            default_response=MockLLM.create_response(
+                answer="Not defined in the paper",
+                citations=["s1_p1"],
+                confidence="high"
+            )
+        )
+        
+        state: QAState = {
+            "document": sample_document,
+            "paragraph_ids": ["s1_p1"],
+            "question": "What is quantum computing?",
+            "llm": mock_llm,
+            "paragraphs": sample_document.get_paragraphs(["s1_p1"]),
+        }
+        
+        result = explain_node(state)
+        
+        assert result["final_response"]["answer"] == "Not defined in the paper"
+        assert result["final_response"]["citations"] == []
+    
+    def test_citations_share_paragraph_id_strings(self, sample_document: Document):
+        """Test that kept citations are the interned paragraph ID strings."""
+        mock_llm = MockLLM(
+            default_response=MockLLM.create_response(
+                answer="Test answer",
+                citations=["s1_p1", "s9_p9"],
+                confidence="high"
+            )
+        )
+        
+        paragraphs = sample_document.get_paragraphs(["s1_p1"])
+        state: QAState = {
+            "document": sample_document,
+            "paragraph_ids": ["s1_p1"],
+            "question": "What is a neural network?",
+            "llm": mock_llm,
+            "paragraphs": paragraphs,
+        }
+        
+        result = explain_node(state)
+        
+        citations = result["final_response"]["citations"]
+        assert citations == ["s1_p1"]
+        assert citations[0] is paragraphs[0].paragraph_id
 
 
 # =============================================================================
@@ -5,12 +5,17 @@ These tests verify the robust JSON extraction helper functions
 that handle various LLM output formats.
 """
 
+import json
+
 import pytest
 
+from evidex import llm as llm_module
 from evidex.llm import (
+    MockLLM,
     extract_json_block,
     safe_parse_json,
     parse_llm_response,
+    parse_llm_response_batch,
     LLMResponse,
 )
 
@@ -76,6 +81,12 @@ class TestExtractJsonBlock:
         with pytest.raises(ValueError, match="Unbalanced"):
             extract_json_block(text)
     
+    def test_non_strict_json_uses_brace_matching(self) -> None:
+        """Falls back to brace matching when the block is not strict JSON."""
+        text = "Result: {answer: 'test', nested: {a: 1}} trailing"
+        result = extract_json_block(text)
+        assert result == "{answer: 'test', nested: {a: 1}}"
+    
     def test_complex_real_response(self) -> None:
         """Extracts JSON from realistic LLM response."""
         text = '''Based on the document, I found the following information:
@@ -131,6 +142,13 @@ class TestSafeParseJson:
         
         assert result["answer"] == "test"
     
+    def test_json_in_markdown_block_with_prose(self) -> None:
+        """Extracts fenced JSON surrounded by explanation."""
+        text = 'Sure:\n```json {"answer": "test"}\n```\nDone.'
+        result = safe_parse_json(text)
+        
+        assert result["answer"] == "test"
+    
     def test_json_with_surrounding_text(self) -> None:
         """Extracts JSON from text with explanation."""
         text = '''Here's my answer:
@@ -144,6 +162,18 @@ This is based on the provided paragraphs.'''
         assert "attention" in result["answer"]
         assert result["citations"] == ["s1_p1"]
     
+    def test_truncated_json_raises_error(self) -> None:
+        """Raises ValueError for JSON cut off mid-object."""
+        text = '{"answer": "test", "citations": ["p1"'
+        
+        with pytest.raises(ValueError, match="Could not parse"):
+            safe_parse_json(text)
+    
+    def test_empty_content_raises_error(self) -> None:
+        """Raises ValueError for empty content."""
+        with pytest.raises(ValueError, match="Could not parse"):
+            safe_parse_json("   ")
+    
     def test_invalid_json_raises_error(self) -> None:
         """Raises ValueError for unparseable content."""
         text = "This is not JSON at all"
@@ -189,9 +219,115 @@ class TestParseLLMResponse:
         
         assert result["citations"] == ["p1", "p2", "eq_1"]
     
+    def test_repeated_content_returns_independent_dicts(self) -> None:
+        """Repeated identical responses parse to separate, equal dicts."""
+        content = 'Answer:\n{"answer": "Test", "citations": ["p1"], "confidence": "high"}'
+        first = parse_llm_response(LLMResponse(content=content))
+        first["citations"].append("p2")
+        
+        second = parse_llm_response(LLMResponse(content=content))
+        
+        assert second["citations"] == ["p1"]
+        assert first is not second
+    
+    def test_new_content_is_parsed_once(self, monkeypatch) -> None:
+        """A response not seen before is parsed a single time."""
+        calls = []
+        original_loads = llm_module._json_loads
+        
+        def counting_loads(text):
+            result = original_loads(text)  # Only successful parses are counted
+            calls.append(text)
+            return result
+        
+        monkeypatch.setattr(llm_module, "_json_loads", counting_loads)
+        
+        parse_llm_response(LLMResponse(content='{"answer": "Once", "citations": [], "confidence": "high"}'))
+        parse_llm_response(LLMResponse(content='Sure:\n{"answer": "Wrapped", "citations": [], "confidence": "low"}'))
+        
+        assert len(calls) == 2
+    
     def test_raises_on_invalid_response(self) -> None:
         """Raises ValueError for invalid response."""
         response = LLMResponse(content="I don't know the answer.")
         
         with pytest.raises(ValueError):
             parse_llm_response(response)
+
+
+# =============================================================================
+# JSON Backend Tests
+# =============================================================================
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch) -> str:
+    """Run a test once with the stdlib parser and once with orjson."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        loads = llm_module._orjson_loads
+    else:
+        loads = json.loads
+    monkeypatch.setattr(llm_module, "_json_loads", loads)
+    llm_module._payload_cache.clear()
+    return request.param
+
+
+class TestJsonBackends:
+    """Tests that parsing behaves the same with either JSON backend."""
+    
+    def test_parses_direct_and_wrapped_json(self, json_backend: str) -> None:
+        """Direct and wrapped payloads parse identically."""
+        payload = {"answer": "Caf\u00e9 \u2014 ok", "citations": ["p1"], "confidence": "high"}
+        direct = json.dumps(payload)
+        
+        assert parse_llm_response(LLMResponse(content=direct)) == payload
+        assert parse_llm_response(LLMResponse(content=f"Here:\n{direct}\nDone.")) == payload
+    
+    def test_accepts_nan_like_stdlib(self, json_backend: str) -> None:
+        """Non-standard constants the stdlib accepts are still accepted."""
+        result = safe_parse_json('{"answer": "x", "score": NaN, "limit": Infinity}')
+        
+        assert result["score"] != result["score"]
+        assert result["limit"] == float("inf")
+    
+    def test_invalid_json_raises_value_error(self, json_backend: str) -> None:
+        """Unparseable content raises ValueError with either backend."""
+        with pytest.raises(ValueError):
+            parse_llm_response(LLMResponse(content='{"answer": }'))
+    
+    def test_create_response_matches_stdlib(self) -> None:
+        """create_response output is the stdlib serialization."""
+        result = MockLLM.create_response(answer="Caf\u00e9", citations=["p1"])
+        
+        assert result == json.dumps({"answer": "Caf\u00e9", "citations": ["p1"], "confidence": "high"})
+
+
+# =============================================================================
+# parse_llm_response_batch Tests
+# =============================================================================
+
+class TestParseLLMResponseBatch:
+    """Tests for the batched LLM response parser."""
+    
+    def test_parses_array(self) -> None:
+        """Parses a bare JSON array of answers."""
+        response = LLMResponse(content='[{"id": 1, "answer": "A"}, {"id": 2, "answer": "B"}]')
+        result = parse_llm_response_batch(response)
+        
+        assert [r["answer"] for r in result] == ["A", "B"]
+    
+    def test_skips_brackets_in_prose(self) -> None:
+        """Skips bracketed prose before the actual array."""
+        response = LLMResponse(
+            content='Answers [see below]:\n```json\n[{"id": 1, "citations": ["p1"]}]\n```'
+        )
+        result = parse_llm_response_batch(response)
+        
+        assert result == [{"id": 1, "citations": ["p1"]}]
+    
+    def test_raises_without_array(self) -> None:
+        """Raises ValueError when there is no JSON array."""
+        response = LLMResponse(content='{"answer": "single", "citations": ["p1"]}')
+        
+        with pytest.raises(ValueError, match="JSON array"):
+            parse_llm_response_batch(response)
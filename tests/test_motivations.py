@@ -13,6 +13,8 @@ Tests cover:
 4. Integration with paragraphs and documents
 """
 
+import dataclasses
+
 import pytest
 from pathlib import Path
 
@@ -25,6 +27,8 @@ from evidex.motivations import (
     extract_motivations_for_document,
     search_motivations,
     get_motivation_summary,
+    MotivationIndex,
+    get_motivation_index,
 )
 
 
@@ -298,6 +302,20 @@ class TestDocumentMotivations:
         
         # s1_p2 has no motivation triggers
         assert "s1_p2" not in motivations_by_para
+    
+    def test_repeated_extraction_reflects_edits(
+        self, document_with_motivations: Document
+    ):
+        """Test that memoized extraction picks up edited paragraph text."""
+        first = extract_motivations_for_document(document_with_motivations)
+        first.clear()
+        
+        para = document_with_motivations.get_paragraph("s1_p2")
+        para.text = "We add dropout because it reduces overfitting on small datasets."
+        second = extract_motivations_for_document(document_with_motivations)
+        
+        assert "s1_p1" in second
+        assert "s1_p2" in second
 
 
 # =============================================================================
@@ -349,6 +367,55 @@ class TestSearchMotivations:
         assert len(results) == 0
 
 
+class TestMotivationIndex:
+    """Tests for the word index over a document's motivations."""
+    
+    def test_index_matches_whole_words(self):
+        """Test that index search matches whole words case-insensitively."""
+        doc = Document(
+            title="Test",
+            sections=[
+                Section(
+                    title="Methods",
+                    paragraphs=[
+                        Paragraph(
+                            paragraph_id="p1",
+                            text="We apply Dropout because it helps prevent overfitting."
+                        ),
+                        Paragraph(
+                            paragraph_id="p2",
+                            text="We use attention in order to model long-range dependencies."
+                        ),
+                    ]
+                )
+            ]
+        )
+        
+        index = get_motivation_index(doc)
+        
+        assert len(index) == 2
+        assert [pid for pid, _ in index.search("dropout")] == ["p1"]
+        assert index.search("drop") == []
+    
+    def test_multi_word_keyword_is_phrase(self, document_with_motivations: Document):
+        """Test that multi-word keywords must appear as a phrase."""
+        index = MotivationIndex(extract_motivations_for_document(document_with_motivations))
+        
+        results = index.search("Dot-Product attention")
+        
+        assert [pid for pid, _ in results] == ["s2_p1"]
+        assert index.search("attention dot-product") == []
+    
+    def test_index_shared_for_unchanged_document(self, document_with_motivations: Document):
+        """Test that the index is reused until the document changes."""
+        first = get_motivation_index(document_with_motivations)
+        
+        assert get_motivation_index(document_with_motivations) is first
+        
+        document_with_motivations.get_paragraph("s1_p2").text = "Edited text."
+        assert get_motivation_index(document_with_motivations) is not first
+
+
 # =============================================================================
 # Summary Tests
 # =============================================================================
@@ -407,6 +474,14 @@ class TestEdgeCases:
         # 'as' is excluded entirely due to too many false positives
         assert len(motivations) == 0
     
+    def test_trigger_inside_word_not_matched(self):
+        """Test that triggers only match at the start of a word."""
+        text = "The layer is disallowing gradients from flowing into the decoder."
+        
+        motivations = extract_motivations(text)
+        
+        assert len(motivations) == 0
+    
     def test_case_insensitive(self):
         """Test that extraction is case insensitive."""
         text = "We use this BECAUSE it is effective. We also do this In Order To improve results."
@@ -521,6 +596,19 @@ class TestMotivationModel:
         assert m.text == "it allows parallel computation"
         assert m.trigger_phrase == "because"
         assert "attention" in m.full_sentence
+        assert m.full_sentence_lower == "we use attention because it allows parallel computation."
+    
+    def test_motivation_is_immutable(self):
+        """Test that Motivation cannot be edited, so full_sentence_lower stays in sync."""
+        m = Motivation(
+            text="it allows parallel computation",
+            trigger_phrase="because",
+            full_sentence="We use attention because it allows parallel computation.",
+        )
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            m.full_sentence = "Something else."
+        assert m.full_sentence_lower == "we use attention because it allows parallel computation."
 
 
 # =============================================================================
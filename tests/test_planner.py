@@ -103,12 +103,12 @@ def attention_document() -> Document:
 
 
 @pytest.fixture
-def sample_state(attention_document: Document) -> QAState:
+def sample_state(attention_document: Document, unused_llm: MockLLM) -> QAState:
     """Create a sample state for testing."""
     return {
         "document": attention_document,
         "question": "How is attention defined?",
-        "llm": MockLLM(),
+        "llm": unused_llm,
     }
 
 
@@ -163,12 +163,12 @@ class TestExtractKeywords:
 class TestPlannerNode:
     """Tests for the planner_node function."""
     
-    def test_selects_paragraphs_for_attention_question(self, attention_document: Document):
+    def test_selects_paragraphs_for_attention_question(self, attention_document: Document, unused_llm: MockLLM):
         """Test that planner selects attention-related paragraphs."""
         state: QAState = {
             "document": attention_document,
             "question": "How is attention defined?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -186,12 +186,12 @@ class TestPlannerNode:
         assert any(pid.startswith("s3_") for pid in candidate_ids), \
             "Should select paragraphs from Attention section"
     
-    def test_selects_none_for_quantum_computing(self, attention_document: Document):
+    def test_selects_none_for_quantum_computing(self, attention_document: Document, unused_llm: MockLLM):
         """Test that planner selects NO paragraphs for unrelated questions."""
         state: QAState = {
             "document": attention_document,
             "question": "What does this paper say about quantum computing?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -203,13 +203,13 @@ class TestPlannerNode:
         assert len(candidate_ids) == 0, \
             "Should not select any paragraphs for questions about topics not in paper"
     
-    def test_uses_provided_paragraph_ids_when_available(self, attention_document: Document):
+    def test_uses_provided_paragraph_ids_when_available(self, attention_document: Document, unused_llm: MockLLM):
         """Test that planner uses explicitly provided paragraph_ids."""
         state: QAState = {
             "document": attention_document,
             "paragraph_ids": ["s1_p1", "s2_p1"],
             "question": "What is attention?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -217,12 +217,12 @@ class TestPlannerNode:
         # Should use the provided IDs directly
         assert result["candidate_paragraph_ids"] == ["s1_p1", "s2_p1"]
     
-    def test_returns_only_existing_paragraph_ids(self, attention_document: Document):
+    def test_returns_only_existing_paragraph_ids(self, attention_document: Document, unused_llm: MockLLM):
         """Test that planner only returns IDs that exist in the document."""
         state: QAState = {
             "document": attention_document,
             "question": "What is attention and transformer architecture?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -237,12 +237,12 @@ class TestPlannerNode:
         for cid in candidate_ids:
             assert cid in valid_ids, f"Planner returned non-existent paragraph ID: {cid}"
     
-    def test_conservative_selection(self, attention_document: Document):
+    def test_conservative_selection(self, attention_document: Document, unused_llm: MockLLM):
         """Test that planner is conservative - selects more rather than fewer."""
         state: QAState = {
             "document": attention_document,
             "question": "Describe the attention mechanism architecture.",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -253,12 +253,12 @@ class TestPlannerNode:
         assert len(candidate_ids) >= 2, \
             "Planner should be conservative and select multiple matching paragraphs"
     
-    def test_selects_transformer_paragraphs(self, attention_document: Document):
+    def test_selects_transformer_paragraphs(self, attention_document: Document, unused_llm: MockLLM):
         """Test selection for transformer-specific question."""
         state: QAState = {
             "document": attention_document,
             "question": "What is the Transformer architecture?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -267,12 +267,12 @@ class TestPlannerNode:
         # Should select Transformer-related paragraphs
         assert "s4_p1" in candidate_ids, "Should select transformer paragraph"
     
-    def test_selects_bleu_score_paragraphs(self, attention_document: Document):
+    def test_selects_bleu_score_paragraphs(self, attention_document: Document, unused_llm: MockLLM):
         """Test selection for BLEU score question."""
         state: QAState = {
             "document": attention_document,
             "question": "What BLEU scores did the model achieve?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -282,6 +282,26 @@ class TestPlannerNode:
         assert any(pid.startswith("s5_") for pid in candidate_ids), \
             "Should select paragraphs from Results section with BLEU scores"
 
+    def test_reflects_edited_paragraph_text(self, unused_llm: MockLLM):
+        """Test that selection follows paragraph edits on the same document."""
+        document = Document(
+            title="Editable",
+            sections=[
+                Section(
+                    title="Intro",
+                    paragraphs=[Paragraph(paragraph_id="p1", text="Dropout regularizes training.")],
+                ),
+            ],
+        )
+        question = "How does quantization work?"
+        
+        first = planner_node({"document": document, "question": question, "llm": unused_llm})
+        assert first["candidate_paragraph_ids"] == []
+        
+        document.sections[0].paragraphs[0].text = "Quantization reduces model precision."
+        second = planner_node({"document": document, "question": question, "llm": unused_llm})
+        assert second["candidate_paragraph_ids"] == ["p1"]
+
 
 # =============================================================================
 # Integration Tests: Planner -> Full Workflow
@@ -363,12 +383,12 @@ class TestPlannerWithRealPDF:
         """Load the real Attention paper."""
         return parse_pdf_to_document(ATTENTION_PAPER_PATH, title="Attention Is All You Need")
     
-    def test_planner_selects_attention_paragraphs_real_pdf(self, real_attention_paper: Document):
+    def test_planner_selects_attention_paragraphs_real_pdf(self, real_attention_paper: Document, unused_llm: MockLLM):
         """Test planner selects attention paragraphs from real PDF."""
         state: QAState = {
             "document": real_attention_paper,
             "question": "How is attention defined in this paper?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -385,12 +405,12 @@ class TestPlannerWithRealPDF:
             assert "attention" in para.text.lower(), \
                 f"Selected paragraph {pid} should mention 'attention'"
     
-    def test_planner_selects_none_for_unrelated_real_pdf(self, real_attention_paper: Document):
+    def test_planner_selects_none_for_unrelated_real_pdf(self, real_attention_paper: Document, unused_llm: MockLLM):
         """Test planner selects nothing for unrelated question on real PDF."""
         state: QAState = {
             "document": real_attention_paper,
             "question": "What does this paper say about blockchain cryptocurrency?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -400,12 +420,12 @@ class TestPlannerWithRealPDF:
         assert len(candidate_ids) == 0, \
             "Planner should not select any paragraphs for topics not in the paper"
     
-    def test_planner_selects_transformer_paragraphs_real_pdf(self, real_attention_paper: Document):
+    def test_planner_selects_transformer_paragraphs_real_pdf(self, real_attention_paper: Document, unused_llm: MockLLM):
         """Test planner selects transformer paragraphs from real PDF."""
         state: QAState = {
             "document": real_attention_paper,
             "question": "What is the Transformer model architecture?",
-            "llm": MockLLM(),
+            "llm": unused_llm,
         }
         
         result = planner_node(state)
@@ -2,10 +2,22 @@
 Unit tests for the Evidex Q&A system.
 """
 
+import asyncio
+import json
+
 import pytest
 from evidex.models import Paragraph, Section, Document, QAResponse
-from evidex.llm import MockLLM, parse_llm_response, LLMResponse
-from evidex.qa import explain_question, build_context_block, build_prompt
+from evidex.llm import MockLLM, CachedLLM, parse_llm_response, LLMResponse
+from evidex.qa import (
+    explain_question,
+    explain_questions_batch,
+    aexplain_question,
+    explain_questions_concurrent,
+    build_context_block,
+    build_prompt,
+    build_prompt_messages,
+    build_batch_prompt,
+)
 
 
 # =============================================================================
@@ -90,6 +102,69 @@ class TestDocumentModel:
         assert len(paras) == 2
         assert paras[0].paragraph_id == "s1_p1"
         assert paras[1].paragraph_id == "s2_p1"
+    
+    def test_get_paragraph_sees_added_paragraphs(self, sample_document: Document):
+        """Test that paragraphs added after a lookup are still found."""
+        assert sample_document.get_paragraph("s3_p2") is None
+        sample_document.sections[2].paragraphs.append(
+            Paragraph(paragraph_id="s3_p2", text="Gradient descent updates weights.")
+        )
+        para = sample_document.get_paragraph("s3_p2")
+        assert para is not None
+        assert para.text == "Gradient descent updates weights."
+    
+    def test_get_paragraph_sees_replaced_paragraphs(self, sample_document: Document):
+        """Test that a paragraph replaced in place is found under its new ID."""
+        assert sample_document.get_paragraph("s1_p1") is not None
+        replacement = Paragraph(paragraph_id="s1_p9", text="Replacement text.")
+        sample_document.sections[0].paragraphs[0] = replacement
+        
+        assert sample_document.get_paragraph("s1_p1") is None
+        assert sample_document.get_paragraph("s1_p9") is replacement
+        
+        # Same ID, new object: the new object must be returned
+        same_id = Paragraph(paragraph_id="s1_p9", text="Second replacement.")
+        sample_document.sections[0].paragraphs[0] = same_id
+        assert sample_document.get_paragraphs(["s1_p9"])[0] is same_id
+    
+    def test_get_paragraph_sees_renamed_and_moved_paragraphs(self, sample_document: Document):
+        """Test that renamed, inserted and removed paragraphs are found correctly."""
+        paragraphs = sample_document.sections[0].paragraphs
+        first = paragraphs[0]
+        assert sample_document.get_paragraph("s1_p1") is first
+        
+        first.paragraph_id = "s1_renamed"
+        assert sample_document.get_paragraph("s1_p1") is None
+        assert sample_document.get_paragraph("s1_renamed") is first
+        
+        inserted = Paragraph(paragraph_id="s1_p0", text="Inserted first.")
+        paragraphs.insert(0, inserted)
+        assert sample_document.get_paragraph("s1_p0") is inserted
+        assert sample_document.get_paragraph("s1_renamed") is first
+        
+        paragraphs.remove(first)
+        assert sample_document.get_paragraph("s1_renamed") is None
+    
+    def test_get_paragraph_duplicate_ids_first_wins(self):
+        """Test that the first paragraph with a duplicated ID is returned."""
+        document = Document(
+            title="Duplicates",
+            sections=[
+                Section(title="A", paragraphs=[Paragraph(paragraph_id="p", text="first")]),
+                Section(title="B", paragraphs=[Paragraph(paragraph_id="p", text="second")]),
+            ],
+        )
+        assert document.get_paragraph("p").text == "first"
+        assert [p.text for p in document.get_paragraphs(["p", "p"])] == ["first", "first"]
+    
+    def test_paragraph_key_tracks_content(self, sample_document: Document):
+        """Test that the paragraph key lists IDs and texts and follows edits."""
+        key = sample_document.paragraph_key()
+        assert key[0] == ("s1_p1", sample_document.sections[0].paragraphs[0].text)
+        
+        sample_document.sections[0].paragraphs[0].text = "Edited."
+        assert sample_document.paragraph_key() != key
+        assert sample_document.paragraph_key()[0] == ("s1_p1", "Edited.")
 
 
 class TestQAResponse:
@@ -152,6 +227,52 @@ class TestMockLLM:
         assert parsed["citations"] == ["p1"]
 
 
+class TestCachedLLM:
+    """Tests for the CachedLLM response cache."""
+    
+    def test_repeated_prompt_served_from_cache(self):
+        """Test that an identical prompt only reaches the wrapped LLM once."""
+        inner = MockLLM()
+        llm = CachedLLM(inner)
+        
+        first = llm.generate("prompt 1")
+        second = llm.generate("prompt 1")
+        
+        assert second.content == first.content
+        assert inner.call_history == ["prompt 1"]
+        assert (llm.hits, llm.misses) == (1, 1)
+    
+    def test_messages_keyed_by_role_and_content(self):
+        """Test that message lists are cached separately from joined prompts."""
+        inner = MockLLM()
+        llm = CachedLLM(inner)
+        messages = [
+            {"role": "system", "content": "rules"},
+            {"role": "user", "content": "question"},
+        ]
+        
+        llm.generate_messages(messages)
+        llm.generate_messages(list(messages))
+        llm.generate_messages([{"role": "user", "content": "rules"}, messages[1]])
+        
+        assert len(inner.call_history) == 2
+        assert llm.hits == 1
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest entry is dropped once maxsize is exceeded."""
+        inner = MockLLM()
+        llm = CachedLLM(inner, maxsize=2)
+        
+        llm.generate("a")
+        llm.generate("b")
+        llm.generate("a")
+        llm.generate("c")
+        llm.generate("a")
+        llm.generate("b")
+        
+        assert inner.call_history == ["a", "b", "c", "b"]
+
+
 class TestParseResponse:
     """Tests for LLM response parsing."""
     
@@ -399,3 +520,224 @@ class TestBuildPrompt:
         assert "test question" in prompt
         assert "JSON" in prompt
         assert "DOCUMENT CONTENT" in prompt
+
+
+class TestBuildPromptMessages:
+    """Tests for the cache-friendly message form of the prompt."""
+    
+    def test_messages_join_to_prompt(self):
+        """Test that joined message contents equal the plain prompt."""
+        messages = build_prompt_messages("context text", "test question", "[eq1]\nx = y")
+        
+        joined = "".join(m["content"] for m in messages)
+        
+        assert joined == build_prompt("context text", "test question", "[eq1]\nx = y")
+    
+    def test_question_is_last_message(self):
+        """Test that only the final message depends on the question."""
+        first = build_prompt_messages("context text", "first question")
+        second = build_prompt_messages("context text", "second question")
+        
+        assert first[0]["role"] == "system"
+        assert first[:-1] == second[:-1]
+        assert "second question" in second[-1]["content"]
+    
+    def test_default_generate_messages_uses_joined_prompt(self):
+        """Test that LLMs without message support see the plain prompt."""
+        mock_llm = MockLLM()
+        
+        mock_llm.generate_messages(build_prompt_messages("ctx", "q?"))
+        
+        assert mock_llm.call_history == [build_prompt("ctx", "q?")]
+
+
+# =============================================================================
+# Batched Q&A Tests
+# =============================================================================
+
+class TestBuildBatchPrompt:
+    """Tests for batched prompt building."""
+    
+    def test_batch_prompt_lists_each_question_once(self):
+        """Test that questions are numbered with their allowed paragraphs."""
+        prompt = build_batch_prompt(
+            "context text",
+            [(["s1_p1"], "First question?"), (["s2_p1", "s2_p2"], "Second question?")],
+        )
+        
+        assert prompt.count("CRITICAL RULES") == 1
+        assert "Q1 (use only paragraphs s1_p1): First question?" in prompt
+        assert "Q2 (use only paragraphs s2_p1, s2_p2): Second question?" in prompt
+        assert "JSON array" in prompt
+
+
+class TestExplainQuestionsBatch:
+    """Tests for answering several questions with batched LLM calls."""
+    
+    def test_answers_all_questions_in_one_call(self, sample_document: Document):
+        """Test that a batch is answered with a single LLM call, in order."""
+        mock_llm = MockLLM(default_response=json.dumps([
+            {"id": 2, "answer": "Backpropagation trains networks.", "citations": ["s3_p1"]},
+            {"id": 1, "answer": "Computational models.", "citations": ["s1_p1"]},
+        ]))
+        
+        results = explain_questions_batch(
+            sample_document,
+            [(["s1_p1"], "What are neural networks?"), (["s3_p1"], "What is backpropagation?")],
+            mock_llm,
+        )
+        
+        assert len(mock_llm.call_history) == 1
+        assert results[0]["answer"] == "Computational models."
+        assert results[0]["citations"] == ["s1_p1"]
+        assert results[1]["citations"] == ["s3_p1"]
+        # Paragraphs were provided manually, so confidence is low
+        assert all(r["confidence"] == "low" for r in results)
+    
+    def test_matches_explain_question(self, sample_document: Document):
+        """Test that a batched answer equals the individually answered one.
+        
+        explain_question also runs the evidence linker and composer, but
+        their output is not part of its response, so skipping them in the
+        batch path changes nothing the caller sees.
+        """
+        question = (["s1_p1", "s3_p1"], "What are neural networks?")
+        batch_llm = MockLLM(default_response=json.dumps([
+            {"id": 1, "answer": "Computational models.", "citations": ["s1_p1", "s9_p9"]},
+        ]))
+        single_llm = MockLLM(default_response=MockLLM.create_response(
+            answer="Computational models.",
+            citations=["s1_p1", "s9_p9"],
+        ))
+        
+        batched = explain_questions_batch(sample_document, [question], batch_llm)[0]
+        single = explain_question(sample_document, *question, single_llm)
+        
+        assert batched == single
+        assert len(batch_llm.call_history) == 1
+        assert len(single_llm.call_history) == 2  # explain + composer
+    
+    def test_citations_outside_question_context_rejected(self, sample_document: Document):
+        """Test that citing another question's paragraph is not accepted."""
+        mock_llm = MockLLM(default_response=json.dumps([
+            {"id": 1, "answer": "Layers.", "citations": ["s3_p1"]},
+            {"id": 2, "answer": "Backpropagation.", "citations": ["s3_p1"]},
+        ]))
+        
+        results = explain_questions_batch(
+            sample_document,
+            [(["s2_p1"], "What layers exist?"), (["s3_p1"], "How is it trained?")],
+            mock_llm,
+        )
+        
+        assert results[0]["answer"] == "Not defined in the paper"
+        assert results[0]["citations"] == []
+        assert results[1]["citations"] == ["s3_p1"]
+    
+    def test_malformed_citations_handled(self, sample_document: Document):
+        """Test that null, bare-string and non-string citations do not raise."""
+        mock_llm = MockLLM(default_response=json.dumps([
+            {"id": 1, "answer": "Layers.", "citations": None},
+            {"id": 2, "answer": "Backpropagation.", "citations": "s3_p1"},
+            {"id": 3, "answer": "Layers.", "citations": [{"id": "s2_p1"}, ["s2_p1"], "s2_p1"]},
+        ]))
+        
+        results = explain_questions_batch(
+            sample_document,
+            [
+                (["s2_p1"], "What layers exist?"),
+                (["s3_p1"], "How is it trained?"),
+                (["s2_p1"], "What layers exist?"),
+            ],
+            mock_llm,
+        )
+        
+        assert results[0]["answer"] == "Not defined in the paper"
+        assert results[0]["citations"] == []
+        assert results[0]["confidence"] == "low"
+        assert results[1]["citations"] == ["s3_p1"]
+        assert results[2]["citations"] == ["s2_p1"]
+    
+    def test_splits_into_batches(self, sample_document: Document):
+        """Test that questions beyond max_batch_size use another call."""
+        mock_llm = MockLLM(default_response=json.dumps([
+            {"id": 1, "answer": "Answer.", "citations": ["s1_p1"]},
+            {"id": 2, "answer": "Answer.", "citations": ["s1_p1"]},
+        ]))
+        
+        results = explain_questions_batch(
+            sample_document,
+            [(["s1_p1"], "Question one?")] * 3,
+            mock_llm,
+            max_batch_size=2,
+        )
+        
+        assert len(mock_llm.call_history) == 2
+        assert len(results) == 3
+    
+    def test_falls_back_to_single_questions(self, sample_document: Document):
+        """Test that an unparseable batch falls back to per-question calls."""
+        mock_llm = MockLLM(default_response=MockLLM.create_response(
+            answer="Neural networks are computational models.",
+            citations=["s1_p1"],
+        ))
+        
+        results = explain_questions_batch(
+            sample_document,
+            [(["s1_p1"], "What are neural networks?")],
+            mock_llm,
+        )
+        
+        assert results[0]["answer"] == "Neural networks are computational models."
+        assert results[0]["citations"] == ["s1_p1"]
+    
+    def test_invalid_batch_size(self, sample_document: Document):
+        """Test that a non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="max_batch_size"):
+            explain_questions_batch(sample_document, [], MockLLM(), max_batch_size=0)
+
+
+# =============================================================================
+# Async Q&A Tests
+# =============================================================================
+
+class TestAsyncExplain:
+    """Tests for the async and concurrent Q&A entry points."""
+    
+    def test_aexplain_question(self, sample_document: Document):
+        """Test that the async variant returns the same response."""
+        mock_llm = MockLLM(default_response=MockLLM.create_response(
+            answer="Backpropagation trains networks.",
+            citations=["s3_p1"],
+        ))
+        
+        result = asyncio.run(aexplain_question(
+            sample_document, ["s3_p1"], "What is backpropagation?", mock_llm
+        ))
+        
+        assert result["citations"] == ["s3_p1"]
+        assert result["confidence"] == "low"
+    
+    def test_concurrent_preserves_order(self, sample_document: Document):
+        """Test that concurrent results come back in request order."""
+        mock_llm = MockLLM(keyword_responses={
+            "question one": MockLLM.create_response(answer="One.", citations=["s1_p1"]),
+            "question two": MockLLM.create_response(answer="Two.", citations=["s2_p1"]),
+        })
+        requests = [
+            (sample_document, ["s1_p1"], "Question one?"),
+            (sample_document, ["s2_p1"], "Question two?"),
+        ] * 3
+        
+        results = asyncio.run(explain_questions_concurrent(
+            requests, mock_llm, max_concurrency=2, requests_per_minute=6000
+        ))
+        
+        assert [r["answer"] for r in results] == ["One.", "Two."] * 3
+    
+    def test_concurrent_rejects_invalid_limits(self, sample_document: Document):
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(explain_questions_concurrent([], MockLLM(), max_concurrency=0))
+        with pytest.raises(ValueError, match="requests_per_minute"):
+            asyncio.run(explain_questions_concurrent([], MockLLM(), requests_per_minute=0))